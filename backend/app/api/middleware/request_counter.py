@@ -6,14 +6,17 @@ from datetime import datetime, timezone
 from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
 from starlette.requests import Request
 from starlette.responses import Response
-from sqlalchemy import select
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncEngine
 
-from backend.app.db import ensure_database_ready, get_sessionmaker
+from backend.app.db import ensure_database_ready, get_engine
 from backend.app.models.config import RequestCountModel
 
 logger = logging.getLogger(__name__)
 
+# Both supported backends expose INSERT ... ON CONFLICT DO UPDATE with the same API.
+_UPSERT_BUILDERS = {"sqlite": sqlite.insert, "postgresql": postgresql.insert}
+
 
 class RequestCounterMiddleware(BaseHTTPMiddleware):
     """Record daily API request totals for usage metrics."""
@@ -21,7 +24,8 @@ class RequestCounterMiddleware(BaseHTTPMiddleware):
     def __init__(self, app, *, database_url: str) -> None:  # type: ignore[override]
         super().__init__(app)
         self._database_url = database_url
-        self._sessions: async_sessionmaker[AsyncSession] = get_sessionmaker(database_url)
+        self._engine: AsyncEngine = get_engine(database_url)
+        self._upsert = _UPSERT_BUILDERS[self._engine.dialect.name](RequestCountModel)
         self._schema_ready = False
 
     async def dispatch(self, request: Request, call_next: RequestResponseEndpoint) -> Response:  # type: ignore[override]
@@ -49,26 +53,18 @@ class RequestCounterMiddleware(BaseHTTPMiddleware):
         return path.startswith("/api")
 
     async def _increment_counter(self) -> None:
-        today = datetime.now(timezone.utc).date()
-
         now = datetime.now(timezone.utc)
 
         await self._ensure_schema()
 
-        async with self._sessions() as session:
-
-            stmt = select(RequestCountModel).where(RequestCountModel.date == today)
-            result = await session.execute(stmt)
-            row = result.scalar_one_or_none()
-
-            if row is None:
-                row = RequestCountModel(date=today, requests=1, updated_at=now)
-                session.add(row)
-            else:
-                row.requests += 1
-                row.updated_at = now
-
-            await session.commit()
+        # One atomic statement: insert the day's row or bump it when it already exists.
+        stmt = self._upsert.values(date=now.date(), requests=1, updated_at=now)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[RequestCountModel.date],
+            set_={"requests": RequestCountModel.requests + 1, "updated_at": now},
+        )
+        async with self._engine.begin() as connection:
+            await connection.execute(stmt)
 
     async def _ensure_schema(self) -> None:
         if self._schema_ready:
@@ -1,8 +1,10 @@
 from __future__ import annotations
 
 import asyncio
-from functools import lru_cache
+from typing import Any
+from weakref import WeakKeyDictionary, WeakSet
 
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.pool import StaticPool
 
@@ -11,8 +13,39 @@ from backend.app.db.base import Base
 
 _MODELS_LOADED = False
 _MODELS_LOCK = asyncio.Lock()
-_SCHEMA_LOCK = asyncio.Lock()
+# asyncio.Lock binds to the loop it first waits on, so keep one per running loop.
+_SCHEMA_LOCKS: WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Lock] = WeakKeyDictionary()
 _INITIALIZED_URLS: set[str] = set()
+_INITIALIZED_ENGINES: WeakSet[AsyncEngine] = WeakSet()
+# Keyed by URL rather than an LRU cache: evicting an engine would drop the last
+# reference to its pool without closing the connections still checked into it.
+_ENGINES: dict[str, AsyncEngine] = {}
+_SESSIONMAKERS: dict[str, async_sessionmaker[AsyncSession]] = {}
+
+# Applied to every new SQLite connection. File databases get WAL with NORMAL
+# syncing and memory-mapped reads; in-memory databases have nothing to sync or
+# map, so syncing is switched off. page_size only takes effect on a database
+# that has not been written yet, so it has to run before journal_mode=WAL.
+_SQLITE_PRAGMAS: tuple[str, ...] = (
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-20000",
+    "PRAGMA busy_timeout=5000",
+)
+_SQLITE_FILE_PRAGMAS: tuple[str, ...] = (
+    "PRAGMA page_size=8192",
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA mmap_size=268435456",
+)
+_SQLITE_MEMORY_PRAGMAS: tuple[str, ...] = ("PRAGMA synchronous=OFF",)
+
+
+def _schema_lock() -> asyncio.Lock:
+    loop = asyncio.get_running_loop()
+    lock = _SCHEMA_LOCKS.get(loop)
+    if lock is None:
+        lock = _SCHEMA_LOCKS[loop] = asyncio.Lock()
+    return lock
 
 
 def _load_models() -> None:
@@ -29,68 +62,118 @@ def _load_models() -> None:
     _MODELS_LOADED = True
 
 
-@lru_cache(maxsize=4)
+def _is_memory_url(database_url: str) -> bool:
+    """Return True for SQLite URLs that never touch the filesystem."""
+
+    return ":memory:" in database_url or "mode=memory" in database_url
+
+
+def _install_sqlite_pragmas(engine: AsyncEngine, *, in_memory: bool) -> None:
+    """Tune each SQLite connection as it is opened by the pool."""
+
+    pragmas = (_SQLITE_MEMORY_PRAGMAS if in_memory else _SQLITE_FILE_PRAGMAS) + _SQLITE_PRAGMAS
+
+    @event.listens_for(engine.sync_engine, "connect")
+    def _set_pragmas(dbapi_connection: Any, _connection_record: Any) -> None:
+        cursor = dbapi_connection.cursor()
+        try:
+            for pragma in pragmas:
+                cursor.execute(pragma)
+        finally:
+            cursor.close()
+
+
 def get_engine(database_url: str | None = None) -> AsyncEngine:
-    """Return a cached async engine for the provided database URL."""
+    """Return the shared async engine for the provided database URL, creating it on first use."""
+
+    url = database_url or get_settings().database_url
+    engine = _ENGINES.get(url)
+    if engine is None:
+        engine = _ENGINES[url] = _build_engine(url)
+    return engine
 
-    if database_url is None:
-        database_url = get_settings().database_url
 
+def _build_engine(database_url: str) -> AsyncEngine:
     engine_kwargs: dict[str, object] = {
         "echo": False,
         "pool_pre_ping": True,
         "future": True,
     }
 
-    if database_url.startswith("sqlite+"):
+    is_sqlite = database_url.startswith("sqlite+")
+    in_memory = is_sqlite and _is_memory_url(database_url)
+    if is_sqlite:
         engine_kwargs["connect_args"] = {"check_same_thread": False}
-        if ":memory:" in database_url:
+        if in_memory:
             engine_kwargs["poolclass"] = StaticPool
 
-    return create_async_engine(database_url, **engine_kwargs)
+    engine = create_async_engine(database_url, **engine_kwargs)
+    if is_sqlite:
+        _install_sqlite_pragmas(engine, in_memory=in_memory)
+    return engine
 
 
-@lru_cache(maxsize=4)
 def get_sessionmaker(database_url: str | None = None) -> async_sessionmaker[AsyncSession]:
     """Return a cached async session factory bound to the shared engine."""
 
-    engine = get_engine(database_url)
-    return async_sessionmaker(engine, expire_on_commit=False)
+    url = database_url or get_settings().database_url
+    sessions = _SESSIONMAKERS.get(url)
+    if sessions is None:
+        sessions = _SESSIONMAKERS[url] = async_sessionmaker(get_engine(url), expire_on_commit=False)
+    return sessions
 
 
-async def ensure_database_ready(database_url: str | None = None) -> None:
-    """Create database tables if they are not already present."""
+async def ensure_database_ready(
+    database_url: str | None = None,
+    *,
+    engine: AsyncEngine | None = None,
+) -> None:
+    """Create database tables if they are not already present.
 
-    url = database_url or get_settings().database_url
+    Pass ``engine`` to prepare a caller-owned engine instead of the cached one for the URL.
+    """
 
     async with _MODELS_LOCK:
         _load_models()
 
+    if engine is not None:
+        if engine in _INITIALIZED_ENGINES:
+            return
+        async with _schema_lock():
+            if engine in _INITIALIZED_ENGINES:
+                return
+            await _create_schema(engine)
+            _INITIALIZED_ENGINES.add(engine)
+        return
+
+    url = database_url or get_settings().database_url
     if url in _INITIALIZED_URLS:
         return
 
-    async with _SCHEMA_LOCK:
+    async with _schema_lock():
         if url in _INITIALIZED_URLS:
             return
 
-        engine = get_engine(url)
-        async with engine.begin() as connection:
-            await connection.run_sync(Base.metadata.create_all)
-
+        await _create_schema(get_engine(url))
         _INITIALIZED_URLS.add(url)
 
 
-async def dispose_engine(database_url: str | None = None) -> None:
-    """Dispose the cached engine for the given database URL if initialised."""
+async def _create_schema(engine: AsyncEngine) -> None:
+    async with engine.begin() as connection:
+        await connection.run_sync(Base.metadata.create_all)
 
-    url = database_url or get_settings().database_url
 
-    engine = get_engine(url)
-    await engine.dispose()
+async def dispose_engine(database_url: str | None = None) -> None:
+    """Dispose the cached engine for the given database URL if initialised.
 
-    if url in _INITIALIZED_URLS:
-        _INITIALIZED_URLS.remove(url)
+    Only this URL's engine and session factory are dropped, so engines other callers
+    still hold for different URLs stay registered and can be disposed later.
+    """
+
+    url = database_url or get_settings().database_url
 
-    # Clear caches so the next startup rebuilds state.
-    get_engine.cache_clear()
-    get_sessionmaker.cache_clear()
+    _SESSIONMAKERS.pop(url, None)
+    _INITIALIZED_URLS.discard(url)
+    engine = _ENGINES.pop(url, None)
+    if engine is not None:
+        await engine.dispose()
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import hashlib
 from datetime import datetime, timezone
+from functools import lru_cache
 from typing import Any, Iterable, Sequence
 from uuid import UUID
 
@@ -24,12 +25,24 @@ DEFAULT_CHAT_SYSTEM_PROMPT = (
     "deliver concise follow-up responses with clear evidence."
 )
 
+_CHAT_RESPONSE_INSTRUCTIONS = (
+    "Respond with a JSON object containing: answer (string), created_at (ISO-8601), "
+    "evidence (list with clip_id, label, timestamp_range [start, end], description), "
+    "and clips (array of UUIDs referenced in the response)."
+)
+
 
 def compute_clip_selection_hash(clip_ids: Sequence[UUID]) -> str:
     """Deterministically hash selected clip IDs for history lookups."""
 
+    return _hash_clip_selection(frozenset(clip_ids))
+
+
+@lru_cache(maxsize=1024)
+def _hash_clip_selection(clip_ids: frozenset[UUID]) -> str:
     unique = sorted({str(value) for value in clip_ids})
-    digest = hashlib.sha256("|".join(unique).encode("utf-8")).hexdigest()
+    # A lookup key, not a credential: allow the digest on FIPS-restricted builds.
+    digest = hashlib.sha256("|".join(unique).encode("utf-8"), usedforsecurity=False).hexdigest()
     return digest
 
 
@@ -61,13 +74,7 @@ def build_chat_prompt(
     sections.append("New question:")
     sections.append(message.strip())
 
-    sections.append(
-        (
-            "Respond with a JSON object containing: answer (string), created_at (ISO-8601), "
-            "evidence (list with clip_id, label, timestamp_range [start, end], description), "
-            "and clips (array of UUIDs referenced in the response)."
-        )
-    )
+    sections.append(_CHAT_RESPONSE_INSTRUCTIONS)
 
     return "\n\n".join(section for section in sections if section)
 
@@ -213,22 +220,37 @@ def _normalize_clip_ids_sequence(clips: Sequence[UUID]) -> list[UUID]:
 
 
 def _render_clip_context(analyses: Sequence[AnalysisRecord]) -> str:
-    lines: list[str] = []
     label_prefix = ord("A")
+    sections = [
+        _render_clip_section(
+            chr(label_prefix + index),
+            record.clip_id,
+            record.summary,
+            tuple(record.moments),
+        )
+        for index, record in enumerate(analyses)
+    ]
+    return "\n".join(sections)
 
-    for index, record in enumerate(analyses, start=1):
-        label = chr(label_prefix + index - 1)
-        lines.append(f"Clip {label} (clip_id={record.clip_id})")
 
-        summary = record.summary.strip() if isinstance(record.summary, str) else None
-        lines.append(f"Summary: {summary or 'No summary available.'}")
+@lru_cache(maxsize=256)
+def _render_clip_section(
+    label: str,
+    clip_id: UUID,
+    summary: str | None,
+    moments: tuple[Moment, ...],
+) -> str:
+    lines = [f"Clip {label} (clip_id={clip_id})"]
 
-        lines.append("Key moments:")
-        moment_lines = list(_iter_moment_lines(record.moments))
-        if moment_lines:
-            lines.extend(moment_lines)
-        else:
-            lines.append("- No notable moments recorded.")
+    cleaned_summary = summary.strip() if isinstance(summary, str) else None
+    lines.append(f"Summary: {cleaned_summary or 'No summary available.'}")
+
+    lines.append("Key moments:")
+    moment_lines = list(_iter_moment_lines(moments))
+    if moment_lines:
+        lines.extend(moment_lines)
+    else:
+        lines.append("- No notable moments recorded.")
 
     return "\n".join(lines)
 
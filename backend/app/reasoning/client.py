@@ -1,11 +1,11 @@
 from __future__ import annotations
 
-import json
 import re
 import textwrap
 from typing import Any
 
 import httpx
+import orjson
 
 from backend.app.core.config import Settings, get_settings
 from backend.app.core.logging import get_logger, latency_timer
@@ -22,10 +22,12 @@ class HafniaReasoningClient(ReasoningClientProtocol):
         settings: Settings | None = None,
         timeout: float = 45.0,
         temperature: float = 0.2,
+        transport: httpx.AsyncBaseTransport | None = None,
     ) -> None:
         self._settings = settings or get_settings()
         self._timeout = timeout
         self._temperature = temperature
+        self._transport = transport
         self._logger = get_logger("hafnia.reasoning")
 
     async def request_reasoning(
@@ -61,6 +63,7 @@ class HafniaReasoningClient(ReasoningClientProtocol):
                 async with httpx.AsyncClient(
                     base_url=str(self._settings.hafnia_base_url),
                     timeout=self._timeout,
+                    transport=self._transport,
                 ) as client:
                     response = await client.post(
                         "/chat/completions",
@@ -76,7 +79,7 @@ class HafniaReasoningClient(ReasoningClientProtocol):
                     "Hafnia comparative reasoning request failed"
                 ) from exc
 
-        data = response.json()
+        data = orjson.loads(response.content)
         parsed, raw_text = self._extract_payload(data)
 
         self._logger.info(
@@ -149,32 +152,27 @@ class HafniaReasoningClient(ReasoningClientProtocol):
 
     @staticmethod
     def _loads_relaxed(text: str) -> Any:
-        def try_load(candidate: str) -> Any | None:
-            try:
-                return json.loads(candidate)
-            except json.JSONDecodeError:
-                return None
-
-        queue: list[str] = [text]
-        seen: set[str] = set()
-
-        while queue:
-            current = queue.pop()
-            if current in seen:
-                continue
-            seen.add(current)
+        parsed = _try_load_json(text)
+        if parsed is not None:
+            return parsed
 
-            parsed = try_load(current)
+        # Each repair is a single precompiled substitution; try them in a fixed
+        # order instead of searching over every combination.
+        quoted = _RELAX_JSON_TIME_VALUES.sub(_quote_time_value, text)
+        if quoted != text:
+            parsed = _try_load_json(quoted)
             if parsed is not None:
                 return parsed
 
-            sanitized = _RELAX_JSON_TRAILING_COMMAS.sub("", current)
-            if sanitized != current and sanitized not in seen:
-                queue.append(sanitized)
+        sanitized = _RELAX_JSON_TRAILING_COMMAS.sub("", text)
+        if sanitized != text:
+            parsed = _try_load_json(sanitized)
+            if parsed is not None:
+                return parsed
 
-            quoted = _RELAX_JSON_TIME_VALUES.sub(_quote_time_value, current)
-            if quoted != current and quoted not in seen:
-                queue.append(quoted)
+        repaired = _RELAX_JSON_TRAILING_COMMAS.sub("", quoted)
+        if repaired not in (quoted, sanitized):
+            return _try_load_json(repaired)
 
         return None
 
@@ -352,6 +350,13 @@ _RELAX_JSON_TIME_VALUES = re.compile(
 )
 
 
+def _try_load_json(candidate: str) -> Any | None:
+    try:
+        return orjson.loads(candidate)
+    except orjson.JSONDecodeError:
+        return None
+
+
 def _quote_time_value(match: re.Match[str]) -> str:
     prefix = match.group("prefix")
     time_value = match.group("time")
@@ -1,9 +1,11 @@
 from __future__ import annotations
 
+import asyncio
 from collections import Counter
+from functools import lru_cache
 import math
 import re
-from typing import Any, Iterable, Protocol, Sequence
+from typing import Any, Iterable, Iterator, Protocol, Sequence
 from uuid import UUID
 
 from backend.app.core.logging import get_logger, latency_timer
@@ -21,6 +23,13 @@ DEFAULT_COMPARE_SYSTEM_PROMPT = (
     "matching the requested schema and avoid echoing the raw clip summaries or JSON."
 )
 
+_COMPARE_RESPONSE_INSTRUCTIONS = (
+    "Respond with a single JSON object containing: answer (clip_a, clip_b, equal, uncertain), "
+    "explanation, evidence (list with clip_id, label, timestamp_range [start, end], description), "
+    "metrics (counts_by_label, severity_distribution), and confidence (0-1). Do not include any "
+    "extra narration, markdown, or the raw clip JSON."
+)
+
 
 class ReasoningClientProtocol(Protocol):
     """Protocol describing the reasoning client surface required for comparisons."""
@@ -76,11 +85,12 @@ class CompareService:
         if not trimmed_question:
             raise ValueError("question must be a non-empty string")
 
-        analysis_a = await self._store.get_latest_analysis(clip_a_id)
+        analysis_a, analysis_b = await asyncio.gather(
+            self._store.get_latest_analysis(clip_a_id),
+            self._store.get_latest_analysis(clip_b_id),
+        )
         if analysis_a is None:
             raise MissingAnalysisError(clip_a_id)
-
-        analysis_b = await self._store.get_latest_analysis(clip_b_id)
         if analysis_b is None:
             raise MissingAnalysisError(clip_b_id)
 
@@ -132,15 +142,8 @@ def build_compare_prompt(
     sections.append(_render_clip_section(name="Clip A", record=clip_a))
     sections.append(_render_clip_section(name="Clip B", record=clip_b))
 
-    instructions = (
-        "Respond with a single JSON object containing: answer (clip_a, clip_b, equal, uncertain), "
-        "explanation, evidence (list with clip_id, label, timestamp_range [start, end], description), "
-        "metrics (counts_by_label, severity_distribution), and confidence (0-1). Do not include any "
-        "extra narration, markdown, or the raw clip JSON."
-    )
-
     sections.append(f"Question: {question}")
-    sections.append(instructions)
+    sections.append(_COMPARE_RESPONSE_INSTRUCTIONS)
 
     return "\n\n".join(sections)
 
@@ -164,23 +167,33 @@ def normalize_compare_response(payload: dict[str, Any]) -> ReasoningComparisonRe
 
 
 def _render_clip_section(*, name: str, record: AnalysisRecord) -> str:
-    summary = record.summary.strip() if isinstance(record.summary, str) else None
-    summary_text = summary or "No summary available."
+    return _render_clip_section_cached(name, record.clip_id, record.summary, tuple(record.moments))
+
+
+@lru_cache(maxsize=256)
+def _render_clip_section_cached(
+    name: str,
+    clip_id: UUID,
+    summary: str | None,
+    moments: tuple[Moment, ...],
+) -> str:
+    cleaned_summary = summary.strip() if isinstance(summary, str) else None
+    summary_text = cleaned_summary or "No summary available."
 
-    lines = [f"{name} (clip_id={record.clip_id})", f"Summary: {summary_text}"]
+    lines = [f"{name} (clip_id={clip_id})", f"Summary: {summary_text}"]
 
     lines.append("Key moments:")
-    for line in _iter_moment_lines(record.moments):
+    for line in _iter_moment_lines(moments):
         lines.append(line)
     if len(lines) == 3:  # no moment lines appended
         lines.append("- No notable moments recorded.")
 
-    label_counts = Counter(_safe_label(moment.label) for moment in record.moments if moment.label)
+    label_counts = Counter(_safe_label(moment.label) for moment in moments if moment.label)
     if label_counts:
         formatted = ", ".join(f"{label}={count}" for label, count in sorted(label_counts.items()))
         lines.append(f"Label counts: {formatted}")
 
-    severity_counts = Counter(moment.severity for moment in record.moments if moment.severity)
+    severity_counts = Counter(moment.severity for moment in moments if moment.severity)
     if severity_counts:
         formatted = ", ".join(
             f"{severity}={count}" for severity, count in sorted(severity_counts.items())
@@ -240,37 +253,32 @@ def _normalize_explanation(candidate: Any) -> str:
 def _normalize_evidence(candidate: Any) -> list[ReasoningEvidence]:
     if not isinstance(candidate, Sequence):
         return []
+    return list(_iter_evidence(candidate))
 
-    evidence: list[ReasoningEvidence] = []
-    for item in candidate:
+
+def _iter_evidence(items: Sequence[Any]) -> Iterator[ReasoningEvidence]:
+    """Yield validated evidence entries, skipping malformed items in the same pass."""
+
+    for item in items:
         if not isinstance(item, dict):
             continue
-        clip = item.get("clip_id")
-        try:
-            clip_id = UUID(str(clip))
-        except (TypeError, ValueError):
-            continue
         label = item.get("label")
         if not isinstance(label, str) or not label.strip():
             continue
-        timestamp_range = _normalize_timestamp_range(item.get("timestamp_range"))
+        try:
+            clip_id = UUID(str(item.get("clip_id")))
+        except (TypeError, ValueError):
+            continue
         description = item.get("description")
-        if isinstance(description, str):
-            description = description.strip() or None
-        else:
-            description = None
-        evidence.append(
-            ReasoningEvidence(
-                clip_id=clip_id,
-                label=label.strip(),
-                timestamp_range=timestamp_range,
-                description=description,
-            )
+        yield ReasoningEvidence(
+            clip_id=clip_id,
+            label=label.strip(),
+            timestamp_range=_normalize_timestamp_range(item.get("timestamp_range")),
+            description=(description.strip() or None) if isinstance(description, str) else None,
         )
-    return evidence
 
 
-_TIME_TOKEN = re.compile(r"^\s*(?P<minutes>\d{1,2}):(?P<seconds>\d{2})(?:\.(?P<fraction>\d{1,3}))?\s*$")
+_TIME_TOKEN = re.compile(r"^\s*(?P<minutes>\d{1,2}):(?P<seconds>\d{2}(?:\.\d{1,3})?)\s*$")
 
 
 def _coerce_timestamp(value: Any) -> float | None:
@@ -282,13 +290,7 @@ def _coerce_timestamp(value: Any) -> float | None:
             return None
         match = _TIME_TOKEN.match(stripped)
         if match:
-            minutes = int(match.group("minutes"))
-            seconds = int(match.group("seconds"))
-            fraction = match.group("fraction")
-            total = minutes * 60 + seconds
-            if fraction:
-                total += int(fraction) / (10 ** len(fraction))
-            return float(total)
+            return int(match.group("minutes")) * 60 + float(match.group("seconds"))
         try:
             return float(stripped)
         except ValueError:
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from collections import OrderedDict, defaultdict
+from collections import OrderedDict
 from typing import Any, Mapping, cast
 from uuid import UUID
 
@@ -21,18 +21,22 @@ def summarize_clip_metrics(analysis: AnalysisRecord) -> ReasoningMetricsResponse
 
     return ReasoningMetricsResponse(
         clip_id=analysis.clip_id,
-        counts_by_label=dict(counts),
+        counts_by_label=counts,
         durations_by_label=durations_final,
         severity_distribution=severity_distribution,
         object_graph=object_graph,
     )
 
 
-def _accumulate_moments(moments: list[Moment]) -> tuple[OrderedDict[str, int], OrderedDict[str, float], dict[str, float], dict[str, int]]:
-    counts: OrderedDict[str, int] = OrderedDict()
-    durations: OrderedDict[str, float] = OrderedDict()
-    severity_totals: dict[str, float] = defaultdict(float)
-    severity_counts: dict[str, int] = defaultdict(int)
+def _accumulate_moments(
+    moments: list[Moment],
+) -> tuple[dict[str, int], dict[str, float], dict[str, float], dict[str, int]]:
+    # Plain dicts keep insertion order, so one pass builds every accumulator
+    # without OrderedDict/defaultdict bookkeeping or a copy afterwards.
+    counts: dict[str, int] = {}
+    durations: dict[str, float] = {}
+    severity_totals: dict[str, float] = {}
+    severity_counts: dict[str, int] = {}
 
     for moment in moments:
         label = _normalize_label(moment.label)
@@ -42,8 +46,8 @@ def _accumulate_moments(moments: list[Moment]) -> tuple[OrderedDict[str, int], O
         durations[label] = durations.get(label, 0.0) + duration
 
         severity = _normalize_label(moment.severity)
-        severity_totals[severity] += duration
-        severity_counts[severity] += 1
+        severity_totals[severity] = severity_totals.get(severity, 0.0) + duration
+        severity_counts[severity] = severity_counts.get(severity, 0) + 1
 
     return counts, durations, severity_totals, severity_counts
 
@@ -1,17 +1,20 @@
 from __future__ import annotations
 
+import copy
 import json
 import os
 from dataclasses import dataclass, replace
 from datetime import datetime, timezone
+from functools import lru_cache
 from typing import Any, Mapping, MutableMapping, cast
 
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
 
 from backend.app.models.config import ConfigModel
 from backend.app.db import ensure_database_ready, get_sessionmaker
 
 _GLOBAL_CONFIG_ID = "global"
+_FEATURE_FLAG_ENVS = ("ENABLE_LIVE_MODE", "ENABLE_GRAPH_VIEW")
 _UNSET = object()
 # Sentinel exported for consumers that need to skip optional updates explicitly.
 UNSET = _UNSET
@@ -40,9 +43,21 @@ class KeyStatus:
 class ConfigStore:
     """Low-level helper for reading and writing operator configuration in SQLite."""
 
-    def __init__(self, database_url: str, *, env: Mapping[str, str] | None = None) -> None:
+    def __init__(
+        self,
+        database_url: str | None = None,
+        *,
+        env: Mapping[str, str] | None = None,
+        engine: AsyncEngine | None = None,
+        sessions: async_sessionmaker[AsyncSession] | None = None,
+    ) -> None:
+        if database_url is None and engine is None:
+            raise ValueError("ConfigStore requires a database_url or an engine")
         self._database_url = database_url
-        self._sessions: async_sessionmaker[AsyncSession] = get_sessionmaker(database_url)
+        self._engine = engine
+        if sessions is None and engine is not None:
+            sessions = async_sessionmaker(engine, expire_on_commit=False)
+        self._sessions: async_sessionmaker[AsyncSession] = sessions or get_sessionmaker(database_url)
         self._schema_ready = False
         self._env: Mapping[str, str] = env if env is not None else cast(MutableMapping[str, str], os.environ)
 
@@ -135,7 +150,7 @@ class ConfigStore:
     async def _ensure_schema(self) -> None:
         if self._schema_ready:
             return
-        await ensure_database_ready(self._database_url)
+        await ensure_database_ready(self._database_url, engine=self._engine)
         self._schema_ready = True
 
     @staticmethod
@@ -180,29 +195,12 @@ class ConfigStore:
         return updated_snapshot
 
     def _collect_feature_flag_overrides(self) -> dict[str, Any]:
-        overrides: dict[str, Any] = {}
-
-        for flag_env in ("ENABLE_LIVE_MODE", "ENABLE_GRAPH_VIEW"):
-            raw = self._env.get(flag_env)
-            if raw is None:
-                continue
-
-            parsed = self._parse_bool(raw)
-            if parsed is not None:
-                overrides[flag_env] = parsed
-
-        raw_feature_flags = self._env.get("CLIPNOTES_FEATURE_FLAGS")
-        if raw_feature_flags:
-            try:
-                payload = json.loads(raw_feature_flags)
-            except json.JSONDecodeError:
-                payload = None
-
-            if isinstance(payload, Mapping):
-                for key, value in payload.items():
-                    overrides[str(key)] = value
-
-        return overrides
+        overrides = _parse_feature_flag_overrides(
+            tuple((flag_env, self._env.get(flag_env)) for flag_env in _FEATURE_FLAG_ENVS),
+            self._env.get("CLIPNOTES_FEATURE_FLAGS"),
+        )
+        # Nested JSON values would otherwise be shared with the cache entry.
+        return {key: copy.deepcopy(value) for key, value in overrides}
 
     def _theme_override_from_env(self) -> dict[str, Any] | None | object:
         raw = self._env.get("CLIPNOTES_THEME_DEFAULT")
@@ -227,3 +225,37 @@ class ConfigStore:
         if normalized in {"0", "false", "no", "off"}:
             return False
         return None
+
+
+@lru_cache(maxsize=32)
+def _parse_feature_flag_overrides(
+    flag_envs: tuple[tuple[str, str | None], ...],
+    raw_feature_flags: str | None,
+) -> tuple[tuple[str, Any], ...]:
+    """Parse feature flag overrides once per distinct set of raw env values.
+
+    The result is shared between calls, so it is returned as a tuple of items;
+    callers must still deep-copy the values before handing them out.
+    """
+
+    overrides: dict[str, Any] = {}
+
+    for flag_env, raw in flag_envs:
+        if raw is None:
+            continue
+
+        parsed = ConfigStore._parse_bool(raw)
+        if parsed is not None:
+            overrides[flag_env] = parsed
+
+    if raw_feature_flags:
+        try:
+            payload = json.loads(raw_feature_flags)
+        except json.JSONDecodeError:
+            payload = None
+
+        if isinstance(payload, Mapping):
+            for key, value in payload.items():
+                overrides[str(key)] = value
+
+    return tuple(overrides.items())
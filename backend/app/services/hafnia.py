@@ -377,7 +377,7 @@ class FakeHafniaClient:
     ) -> AnalysisPayload:
         payload_latency = self._latency_ms
         summary: str | None = f"Analysis for {filename} completed successfully."
-        moments = [replace(moment) for moment in self._default_moments]
+        moments = list(self._default_moments)
         error_code: str | None = None
         error_message: str | None = None
         status = "success"
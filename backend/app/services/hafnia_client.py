@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import asyncio
+from collections.abc import AsyncIterator, Callable
 from typing import Any, Protocol
 from uuid import uuid4
 
@@ -10,6 +11,22 @@ from fastapi import UploadFile
 from backend.app.core.config import Settings, get_settings
 from backend.app.core.logging import get_logger
 
+_UPLOAD_CHUNK_SIZE = 1 << 20
+
+
+def _multipart_envelope(boundary: str, *, filename: str, content_type: str) -> tuple[bytes, bytes]:
+    """Return the multipart/form-data bytes that surround a single ``file`` field."""
+
+    # Quote the filename the way browsers (and httpx) do for form fields.
+    quoted = filename.replace("\\", "\\\\").replace('"', "%22")
+    head = (
+        f"--{boundary}\r\n"
+        f'Content-Disposition: form-data; name="file"; filename="{quoted}"\r\n'
+        f"Content-Type: {content_type}\r\n\r\n"
+    ).encode()
+    tail = f"\r\n--{boundary}--\r\n".encode()
+    return head, tail
+
 
 class HafniaClientError(RuntimeError):
     """Base error for Hafnia client failures."""
@@ -47,9 +64,11 @@ class HafniaClient:
         timeout: float = 60.0,
         max_attempts: int = 3,
         backoff_base: float = 0.5,
+        transport: httpx.AsyncBaseTransport | None = None,
     ) -> None:
         self._settings = settings or get_settings()
         self._timeout = timeout
+        self._transport = transport
         self._logger = get_logger("hafnia")
         self._max_attempts = max(1, max_attempts)
         self._backoff_base = max(0.0, backoff_base)
@@ -57,25 +76,37 @@ class HafniaClient:
     async def upload_asset(self, upload: UploadFile) -> str:
         """Upload the provided video file and return the Hafnia asset identifier."""
 
-        file_bytes = await upload.read()
-        await upload.seek(0)
-
-        files = {
-            "file": (
-                upload.filename or "clip.mp4",
-                file_bytes,
-                upload.content_type or "application/octet-stream",
-            )
-        }
-
-        response = await self._post_with_retry(
-            path="/assets",
-            request_kwargs={
-                "files": files,
-                "headers": self._settings.headers,
-            },
-            error_message="Failed to upload asset to Hafnia",
+        boundary = uuid4().hex
+        head, tail = _multipart_envelope(
+            boundary,
+            filename=upload.filename or "clip.mp4",
+            content_type=upload.content_type or "application/octet-stream",
         )
+        headers = {
+            **self._settings.headers,
+            "Content-Type": f"multipart/form-data; boundary={boundary}",
+        }
+        if upload.size is not None:
+            headers["Content-Length"] = str(len(head) + upload.size + len(tail))
+
+        async def body() -> AsyncIterator[bytes]:
+            # UploadFile.read runs in the threadpool once Starlette has spooled
+            # the clip to disk, so the event loop never blocks on file I/O.
+            await upload.seek(0)
+            yield head
+            while chunk := await upload.read(_UPLOAD_CHUNK_SIZE):
+                yield chunk
+            yield tail
+
+        try:
+            response = await self._post_with_retry(
+                path="/assets",
+                request_kwargs={"headers": headers},
+                error_message="Failed to upload asset to Hafnia",
+                stream_body=body,
+            )
+        finally:
+            await upload.seek(0)
 
         payload = response.json()
         asset_id = self._extract_asset_id(payload)
@@ -200,16 +231,20 @@ class HafniaClient:
         path: str,
         request_kwargs: dict[str, Any],
         error_message: str,
+        stream_body: Callable[[], AsyncIterator[bytes]] | None = None,
     ) -> httpx.Response:
         last_exc: Exception | None = None
 
         for attempt in range(1, self._max_attempts + 1):
+            # A streamed body can only be consumed once, so build a fresh one per attempt.
+            attempt_kwargs = request_kwargs if stream_body is None else {**request_kwargs, "content": stream_body()}
             try:
                 async with httpx.AsyncClient(
                     base_url=str(self._settings.hafnia_base_url),
                     timeout=self._timeout,
+                    transport=self._transport,
                 ) as client:
-                    response = await client.post(path, **request_kwargs)
+                    response = await client.post(path, **attempt_kwargs)
 
                 response.raise_for_status()
                 if attempt > 1:
@@ -269,16 +304,18 @@ class FakeHafniaService(HafniaClientProtocol):
         self._assets: dict[str, dict[str, Any]] = {}
 
     async def upload_asset(self, upload: UploadFile) -> str:
-        content = await upload.read()
+        size = 0
+        while chunk := await upload.read(_UPLOAD_CHUNK_SIZE):
+            size += len(chunk)
         await upload.seek(0)
         asset_id = f"asset_{uuid4().hex}"
         self._assets[asset_id] = {
             "filename": upload.filename or "clip.mp4",
-            "size": len(content),
+            "size": size,
         }
         self._logger.info(
             "fake upload",
-            extra={"asset_id": asset_id, "bytes": len(content)},
+            extra={"asset_id": asset_id, "bytes": size},
         )
         return asset_id
 
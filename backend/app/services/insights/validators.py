@@ -3,6 +3,7 @@ from __future__ import annotations
 from backend.app.models.insights import InsightWindow
 
 SUPPORTED_WINDOWS: tuple[InsightWindow, ...] = ("24h", "7d")
+_ALLOWED_WINDOWS: frozenset[str] = frozenset(SUPPORTED_WINDOWS)
 
 
 def validate_window(value: str | None) -> InsightWindow:
@@ -11,7 +12,7 @@ def validate_window(value: str | None) -> InsightWindow:
         raise ValueError("Window value is required")
 
     normalised = value.strip().lower()
-    if normalised not in SUPPORTED_WINDOWS:
+    if normalised not in _ALLOWED_WINDOWS:
         raise ValueError(f"Unsupported window '{value}'. Expected one of: {', '.join(SUPPORTED_WINDOWS)}")
 
     # typing aid: cast to InsightWindow based on membership check above
@@ -1,30 +1,57 @@
 from __future__ import annotations
 
-from collections import defaultdict
+from collections import Counter
 from datetime import date, datetime, time, timedelta, timezone
 
-from sqlalchemy import Select, case, func, select
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from sqlalchemy import ColumnElement, Date, case, func, select
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
 
 from backend.app.db import ensure_database_ready, get_sessionmaker
 from backend.app.models.config import RequestCountModel
 from backend.app.models.metrics import DailyMetricsBucket, HourlyMetricsBucket, MetricsResponse
 from backend.app.store.sqlite import AnalysisModel, ClipModel
 
+_SECONDS_PER_HOUR = 3600
+
+
+def _epoch_bucket(moment: datetime, bucket_seconds: int) -> int:
+    """Index of the UTC bucket containing ``moment``, counted from the Unix epoch."""
+
+    if moment.tzinfo is None:
+        # SQLite hands back timestamps without their offset; they are stored in UTC.
+        moment = moment.replace(tzinfo=timezone.utc)
+    return int(moment.timestamp()) // bucket_seconds
+
+
+def _utc_date(column: ColumnElement[datetime], dialect_name: str) -> ColumnElement[date]:
+    """Return the UTC calendar date of a timestamp column."""
+
+    if dialect_name == "postgresql":
+        # date(timestamptz) follows the session TimeZone, so shift to UTC first.
+        column = func.timezone("UTC", column)
+    # SQLite stores the timestamps as naive UTC strings, so date() is already UTC.
+    return func.date(column, type_=Date)
+
 
 class MetricsService:
     """Aggregate ClipNotes usage metrics for the dashboard."""
 
     def __init__(
         self,
-        database_url: str,
+        database_url: str | None = None,
         *,
+        engine: AsyncEngine | None = None,
         latency_warning_threshold_ms: int = 5000,
         hourly_window: int = 12,
         daily_window: int = 7,
     ) -> None:
+        if database_url is None and engine is None:
+            raise ValueError("MetricsService requires a database_url or an engine")
         self._database_url = database_url
-        self._sessions: async_sessionmaker[AsyncSession] = get_sessionmaker(database_url)
+        self._engine = engine
+        self._sessions: async_sessionmaker[AsyncSession] = (
+            async_sessionmaker(engine, expire_on_commit=False) if engine is not None else get_sessionmaker(database_url)
+        )
         self._latency_threshold = float(latency_warning_threshold_ms)
         self._hourly_window = hourly_window
         self._daily_window = daily_window
@@ -40,11 +67,9 @@ class MetricsService:
         lookback = self._resolve_window(window)
         window_start = current - lookback
         async with self._sessions() as session:
-            total_clips = await self._scalar_count(session, select(func.count()).select_from(ClipModel))
-            total_analyses = await self._scalar_count(session, select(func.count()).select_from(AnalysisModel))
+            total_clips, total_analyses, error_rate = await self._totals(session)
 
             avg_latency = await self._average_latency(session, window_start)
-            error_rate = await self._error_rate(session)
 
             requests_today = await self._requests_for_day(session, current.date())
             per_day = await self._daily_buckets(session, current)
@@ -83,14 +108,9 @@ class MetricsService:
     async def _ensure_schema(self) -> None:
         if self._initialized:
             return
-        await ensure_database_ready(self._database_url)
+        await ensure_database_ready(self._database_url, engine=self._engine)
         self._initialized = True
 
-    async def _scalar_count(self, session: AsyncSession, stmt: Select) -> int:
-        result = await session.execute(stmt)
-        value = result.scalar_one_or_none()
-        return int(value or 0)
-
     async def _average_latency(self, session: AsyncSession, window_start: datetime) -> float:
         stmt = (
             select(func.avg(AnalysisModel.latency_ms))
@@ -101,27 +121,29 @@ class MetricsService:
         value = result.scalar_one_or_none()
         return float(value or 0.0)
 
-    async def _error_rate(self, session: AsyncSession) -> float | None:
+    async def _totals(self, session: AsyncSession) -> tuple[int, int, float | None]:
+        """Return clip count, analysis count and error rate from a single round trip."""
+
         error_case = case(
             (AnalysisModel.error_code.is_not(None), 1),
             (AnalysisModel.error_message.is_not(None), 1),
             else_=0,
         )
-        stmt = (
-            select(
-                func.count(AnalysisModel.id),
-                func.coalesce(func.sum(error_case), 0),
-            )
+        stmt = select(
+            select(func.count()).select_from(ClipModel).scalar_subquery(),
+            func.count(AnalysisModel.id),
+            func.coalesce(func.sum(error_case), 0),
         )
         result = await session.execute(stmt)
-        total, errors = result.one()
+        clips, analyses, errors = result.one()
 
-        total_count = int(total or 0)
+        total_clips = int(clips or 0)
+        total_analyses = int(analyses or 0)
         error_count = int(errors or 0)
 
-        if total_count == 0:
-            return None
-        return error_count / total_count
+        if total_analyses == 0:
+            return total_clips, total_analyses, None
+        return total_clips, total_analyses, error_count / total_analyses
 
     async def _requests_for_day(self, session: AsyncSession, target: date) -> int:
         stmt = select(RequestCountModel.requests).where(RequestCountModel.date == target)
@@ -140,16 +162,17 @@ class MetricsService:
         ).all()
         request_map = {row[0]: int(row[1]) for row in request_rows}
 
+        # Let the database fold analyses into one row per day instead of
+        # shipping every timestamp in the window back to Python.
+        analysis_day = _utc_date(AnalysisModel.created_at, session.get_bind().dialect.name)
         analysis_rows = (
             await session.execute(
-                select(AnalysisModel.created_at)
+                select(analysis_day, func.count())
                 .where(AnalysisModel.created_at >= day_start_dt)
+                .group_by(analysis_day)
             )
-        ).scalars().all()
-        analysis_map: dict[date, int] = defaultdict(int)
-        for created_at in analysis_rows:
-            day = created_at.astimezone(timezone.utc).date()
-            analysis_map[day] += 1
+        ).all()
+        analysis_map = {row[0]: int(row[1]) for row in analysis_rows}
 
         if not request_map and not analysis_map:
             return []
@@ -183,17 +206,15 @@ class MetricsService:
             )
         ).scalars().all()
 
-        counts: dict[datetime, int] = defaultdict(int)
-        for created_at in analysis_rows:
-            bucket = created_at.astimezone(timezone.utc).replace(minute=0, second=0, microsecond=0)
-            counts[bucket] += 1
+        counts = Counter(_epoch_bucket(created_at, _SECONDS_PER_HOUR) for created_at in analysis_rows)
+        first_hour = _epoch_bucket(hour_start_dt, _SECONDS_PER_HOUR)
 
         buckets: list[HourlyMetricsBucket] = []
         for offset in range(self._hourly_window):
             bucket_start = hour_start_dt + timedelta(hours=offset)
             if bucket_start > current:
                 break
-            count = counts.get(bucket_start, 0)
+            count = counts.get(first_hour + offset, 0)
             if count == 0:
                 continue
             buckets.append(HourlyMetricsBucket(hour=bucket_start, requests=count))
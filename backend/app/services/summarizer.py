@@ -21,6 +21,8 @@ DEFAULT_SYSTEM_PROMPT = (
     " as key_topics, safety_level, and recommended_actions."
 )
 
+_SENTENCE_BREAK = re.compile(r"(?<=\.)\s+")
+
 
 class Summarizer:
     """Primary orchestration surface for the Hafnia summarisation flow."""
@@ -109,7 +111,8 @@ def _extract_bullets(payload: dict[str, Any]) -> list[str]:
     if isinstance(candidate, str):
         candidate = _split_bullets(candidate)
     elif isinstance(candidate, list):
-        candidate = [str(item).strip() for item in candidate if str(item).strip()]
+        # Common case: Hafnia already returns a bullet list, so only clean it up.
+        candidate = _clean_items(candidate)
 
     if candidate:
         return candidate
@@ -118,11 +121,15 @@ def _extract_bullets(payload: dict[str, Any]) -> list[str]:
     if isinstance(summary, str):
         return _split_bullets(summary)
     if isinstance(summary, list):
-        return [str(item).strip() for item in summary if str(item).strip()]
+        return _clean_items(summary)
 
     return []
 
 
+def _clean_items(items: list[Any]) -> list[str]:
+    return [stripped for item in items if (stripped := str(item).strip())]
+
+
 def _split_bullets(text: str) -> list[str]:
     parts = [segment.strip(" \t\r\n-•") for segment in text.splitlines()]
     bullets = [segment for segment in parts if segment]
@@ -130,9 +137,9 @@ def _split_bullets(text: str) -> list[str]:
         return bullets
 
     sentence_parts = [
-        part.strip()
-        for part in re.split(r"(?<=\.)\s+", text.strip())
-        if part.strip()
+        stripped
+        for part in _SENTENCE_BREAK.split(text.strip())
+        if (stripped := part.strip())
     ]
     if len(sentence_parts) > 1:
         return sentence_parts
@@ -9,7 +9,7 @@ from uuid import UUID, uuid4
 ClipStatus = Literal["pending", "processing", "ready", "failed"]
 
 
-@dataclass(slots=True)
+@dataclass(slots=True, frozen=True)
 class Moment:
     """Normalized slice of a clip returned by Hafnia analysis."""
 
@@ -32,7 +32,7 @@ class ClipRecord:
     latency_ms: int | None = None
 
 
-@dataclass(slots=True)
+@dataclass(slots=True, frozen=True)
 class AnalysisPayload:
     """Input payload describing the outcome of an analysis run."""
 
@@ -45,7 +45,7 @@ class AnalysisPayload:
     error_message: str | None = None
 
 
-@dataclass(slots=True)
+@dataclass(slots=True, frozen=True)
 class AnalysisRecord:
     """Persisted analysis entry stored for a clip."""
 
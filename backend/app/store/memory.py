@@ -91,7 +91,7 @@ class InMemoryStore(ClipStore):
             analysis = AnalysisRecord(
                 clip_id=clip_id,
                 summary=payload.summary,
-                moments=[replace(moment) for moment in payload.moments],
+                moments=list(payload.moments),
                 raw=dict(payload.raw),
                 created_at=created_at,
                 latency_ms=payload.latency_ms,
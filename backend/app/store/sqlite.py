@@ -2,11 +2,11 @@ from __future__ import annotations
 
 from dataclasses import asdict
 from datetime import datetime, timezone
-from typing import Any
-from uuid import UUID
+from typing import Any, Sequence
+from uuid import UUID, uuid4
 
-from sqlalchemy import JSON, DateTime, ForeignKey, Integer, String, Text, select
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from sqlalchemy import JSON, DateTime, ForeignKey, Integer, String, Text, insert, select
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
 from sqlalchemy.orm import Mapped, mapped_column
 
 from backend.app.store.base import (
@@ -29,7 +29,9 @@ class ClipModel(Base):
     id: Mapped[str] = mapped_column(String(36), primary_key=True)
     filename: Mapped[str] = mapped_column(String(255), nullable=False)
     status: Mapped[str] = mapped_column(String(32), nullable=False, default="pending")
-    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc))
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), default=lambda: datetime.now(timezone.utc), index=True
+    )
     last_analysis_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
     latency_ms: Mapped[int | None] = mapped_column(Integer, nullable=True)
     asset_id: Mapped[str | None] = mapped_column(String(128), nullable=True, index=True)
@@ -43,13 +45,21 @@ class AnalysisModel(Base):
     summary: Mapped[str | None] = mapped_column(Text, nullable=True)
     moments: Mapped[list[dict[str, Any]]] = mapped_column(JSON, nullable=False, default=list)
     raw: Mapped[dict[str, Any]] = mapped_column(JSON, nullable=False, default=dict)
-    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc))
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), default=lambda: datetime.now(timezone.utc), index=True
+    )
     latency_ms: Mapped[int | None] = mapped_column(Integer, nullable=True)
     prompt: Mapped[str | None] = mapped_column(Text, nullable=True)
     error_code: Mapped[str | None] = mapped_column(String(64), nullable=True)
     error_message: Mapped[str | None] = mapped_column(Text, nullable=True)
 
 
+def memory_database_url() -> str:
+    """Return a unique shared-cache in-memory SQLite URL that lives as long as an engine holds it open."""
+
+    return f"sqlite+aiosqlite:///file:clipnotes-{uuid4().hex}?mode=memory&cache=shared&uri=true"
+
+
 class SqliteStore(ClipStore):
     """SQLAlchemy-powered store implementation backed by an async database engine."""
 
@@ -58,11 +68,29 @@ class SqliteStore(ClipStore):
         self._sessions: async_sessionmaker[AsyncSession] = get_sessionmaker(database_url)
         self._initialized = False
 
+    @classmethod
+    def from_memory(cls) -> SqliteStore:
+        """Build a store on a private in-memory database that lives as long as its engine."""
+
+        return cls(memory_database_url())
+
+    @property
+    def database_url(self) -> str:
+        return self._database_url
+
+    @property
+    def engine(self) -> AsyncEngine:
+        """Return the engine this store's sessions are bound to."""
+
+        return self._sessions.kw["bind"]
+
     async def create_clip(self, *, filename: str) -> ClipRecord:
         await self._ensure_schema()
 
         record = build_clip_record(filename=filename)
-        model = ClipModel(
+        # The record already carries every column value, so a Core INSERT skips
+        # building an ORM instance and the unit-of-work flush for it.
+        stmt = insert(ClipModel).values(
             id=str(record.id),
             filename=record.filename,
             status=record.status,
@@ -70,9 +98,8 @@ class SqliteStore(ClipStore):
             asset_id=record.asset_id,
         )
 
-        async with self._sessions() as session:
-            session.add(model)
-            await session.commit()
+        async with self._sessions.begin() as session:
+            await session.execute(stmt)
 
         return record
 
@@ -150,22 +177,12 @@ class SqliteStore(ClipStore):
                 raise ClipNotFoundError(clip_id)
 
             created_at = datetime.now(timezone.utc)
-            analysis = AnalysisModel(
-                clip_id=str(clip_id),
-                summary=payload.summary,
-                moments=[asdict(moment) for moment in payload.moments],
-                raw=dict(payload.raw),
-                created_at=created_at,
-                latency_ms=payload.latency_ms,
-                prompt=payload.prompt,
-                error_code=payload.error_code,
-                error_message=payload.error_message,
-            )
+            analysis = self._build_analysis(str(clip_id), payload, created_at)
             session.add(analysis)
 
             clip.last_analysis_at = created_at
             clip.latency_ms = payload.latency_ms
-            clip.status = "failed" if payload.error_code or payload.error_message else "ready"
+            clip.status = self._status_for(payload)
 
             await session.commit()
             await session.refresh(clip)
@@ -173,6 +190,31 @@ class SqliteStore(ClipStore):
 
         return self._to_analysis(analysis)
 
+    async def bulk_seed(self, seeds: Sequence[tuple[str, AnalysisPayload]]) -> list[AnalysisRecord]:
+        """Register clips together with their first analysis in a single transaction."""
+
+        await self._ensure_schema()
+
+        analyses: list[AnalysisModel] = []
+        async with self._sessions() as session, session.begin():
+            for filename, payload in seeds:
+                record = build_clip_record(filename=filename)
+                created_at = datetime.now(timezone.utc)
+                clip = ClipModel(
+                    id=str(record.id),
+                    filename=record.filename,
+                    status=self._status_for(payload),
+                    created_at=record.created_at,
+                    last_analysis_at=created_at,
+                    latency_ms=payload.latency_ms,
+                    asset_id=record.asset_id,
+                )
+                analysis = self._build_analysis(clip.id, payload, created_at)
+                session.add_all((clip, analysis))
+                analyses.append(analysis)
+
+        return [self._to_analysis(analysis) for analysis in analyses]
+
     async def get_latest_analysis(self, clip_id: UUID) -> AnalysisRecord | None:
         await self._ensure_schema()
 
@@ -200,7 +242,8 @@ class SqliteStore(ClipStore):
             await session.commit()
 
     async def close(self) -> None:
-        return None
+        # Closing the pooled connections also drops a from_memory() store's private database.
+        await self.engine.dispose()
 
     async def _ensure_schema(self) -> None:
         if self._initialized:
@@ -208,6 +251,24 @@ class SqliteStore(ClipStore):
         await ensure_database_ready(self._database_url)
         self._initialized = True
 
+    @staticmethod
+    def _status_for(payload: AnalysisPayload) -> ClipStatus:
+        return "failed" if payload.error_code or payload.error_message else "ready"
+
+    @staticmethod
+    def _build_analysis(clip_id: str, payload: AnalysisPayload, created_at: datetime) -> AnalysisModel:
+        return AnalysisModel(
+            clip_id=clip_id,
+            summary=payload.summary,
+            moments=[asdict(moment) for moment in payload.moments],
+            raw=dict(payload.raw),
+            created_at=created_at,
+            latency_ms=payload.latency_ms,
+            prompt=payload.prompt,
+            error_code=payload.error_code,
+            error_message=payload.error_message,
+        )
+
     @staticmethod
     def _to_clip(row: ClipModel) -> ClipRecord:
         return ClipRecord(
@@ -0,0 +1,34 @@
+"""index clips and analysis_results on created_at"""
+
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "202511100001"
+down_revision = "202511070001"
+branch_labels = None
+depends_on = None
+
+
+# clips and analysis_results are created by the application on startup rather
+# than by a migration, so only index the tables that already exist.
+_INDEXES = (
+    ("ix_clips_created_at", "clips"),
+    ("ix_analysis_results_created_at", "analysis_results"),
+)
+
+
+def upgrade() -> None:
+    inspector = sa.inspect(op.get_bind())
+    for index_name, table_name in _INDEXES:
+        if inspector.has_table(table_name):
+            op.create_index(index_name, table_name, ["created_at"], if_not_exists=True)
+
+
+def downgrade() -> None:
+    inspector = sa.inspect(op.get_bind())
+    for index_name, table_name in reversed(_INDEXES):
+        if inspector.has_table(table_name):
+            op.drop_index(index_name, table_name=table_name, if_exists=True)
@@ -5,7 +5,7 @@ from fastapi.middleware.cors import CORSMiddleware
 
 from backend.app.api.routes import router as api_router, system_router
 from backend.app.core.config import get_settings
-from backend.app.db import ensure_database_ready
+from backend.app.db import dispose_engine, ensure_database_ready
 
 import os
 
@@ -19,6 +19,7 @@ async def lifespan(app: FastAPI):
     settings = get_settings()
     await ensure_database_ready(settings.database_url)
     yield
+    await dispose_engine(settings.database_url)
 
 
 def create_app() -> FastAPI:
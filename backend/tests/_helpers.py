@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+import itertools
+from typing import Any
+from uuid import UUID
+
+import httpx
+import orjson
+
+from backend.app.models.schemas import ErrorDetail, ErrorResponse
+
+_uuid_counter = itertools.count(1)
+
+
+def tuid() -> UUID:
+    """Return a unique, sequential UUID for test data that does not need randomness."""
+
+    return UUID(int=next(_uuid_counter))
+
+
+def read_json(response: httpx.Response) -> Any:
+    """Decode a response body with orjson instead of the stdlib json module."""
+
+    return orjson.loads(response.content)
+
+
+def assert_error(
+    response: httpx.Response,
+    *,
+    status: int,
+    code: str,
+    message: str | None = None,
+    message_contains: str | None = None,
+    remediation_contains: str | None = None,
+) -> ErrorDetail:
+    """Assert a structured error response and return its validated detail."""
+
+    assert response.status_code == status
+    error = ErrorResponse.model_validate_json(response.content).error
+    assert error.code == code
+    if message is not None:
+        assert error.message == message
+    if message_contains is not None:
+        assert message_contains in error.message
+    if remediation_contains is not None:
+        assert remediation_contains in (error.remediation or "")
+    return error
@@ -1,41 +1,114 @@
 from __future__ import annotations
 
 import os
+from collections.abc import AsyncIterator, Iterator
 from dataclasses import replace
-from collections.abc import AsyncIterator
+from tempfile import SpooledTemporaryFile
 from typing import Awaitable, Callable
 from uuid import uuid4
 
 import pytest
 import pytest_asyncio
+from fastapi import FastAPI, UploadFile
+from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import StaticPool
+from starlette.datastructures import Headers
 
-from backend.app.store import AnalysisPayload, ClipRecord, InMemoryStore, Moment, SqliteStore
+from backend.app.db import ensure_database_ready, get_engine
+from backend.app.services.config_store import ConfigStore
+from backend.app.store import AnalysisPayload, ClipRecord, InMemoryStore, Moment, SqliteStore, sqlite
 
-os.environ.setdefault("HAFNIA_API_KEY", "test-key")
-os.environ.setdefault("HAFNIA_BASE_URL", "https://hafnia.example.com")
-os.environ.setdefault("DATABASE_URL", "sqlite+aiosqlite:///:memory:")
+_TEST_ENV = {
+    "HAFNIA_API_KEY": "test-key",
+    "HAFNIA_BASE_URL": "https://hafnia.example.com",
+    "DATABASE_URL": "sqlite+aiosqlite:///:memory:",
+}
 
 
-@pytest_asyncio.fixture
-async def memory_store() -> AsyncIterator[InMemoryStore]:
-    """Yield a fresh in-memory store for unit tests."""
+def pytest_configure(config: pytest.Config) -> None:
+    """Apply test environment defaults before any test module imports the app."""
+
+    for key, value in _TEST_ENV.items():
+        os.environ.setdefault(key, value)
+
+
+@pytest.fixture(scope="session")
+def fastapi_app() -> FastAPI:
+    """Import the application once per session, after the test environment is configured."""
 
-    store = InMemoryStore()
-    yield store
+    from backend.main import app
+
+    return app
+
+
+@pytest.fixture
+def memory_store() -> InMemoryStore:
+    """Return a fresh in-memory store for each test."""
+
+    return InMemoryStore()
 
 
 @pytest_asyncio.fixture
-async def sqlite_store(tmp_path) -> AsyncIterator[SqliteStore]:
-    """Provide a temporary SQLite-backed store for integration-style tests."""
+async def sqlite_store() -> AsyncIterator[SqliteStore]:
+    """Provide a private in-memory SQLite-backed store for integration-style tests."""
 
-    db_path = tmp_path / "clipnotes.db"
-    store = SqliteStore(f"sqlite+aiosqlite:///{db_path}")
+    store = SqliteStore.from_memory()
     try:
         yield store
     finally:
         await store.close()
 
 
+@pytest_asyncio.fixture
+async def memory_database_url() -> AsyncIterator[str]:
+    """Yield a unique shared-cache in-memory SQLite URL so tests skip disk I/O."""
+
+    database_url = sqlite.memory_database_url()
+    try:
+        yield database_url
+    finally:
+        # Dispose only this URL's engine; clearing the shared caches would orphan engines wider fixtures still use.
+        await get_engine(database_url).dispose()
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def config_engine() -> AsyncIterator[AsyncEngine]:
+    """Yield one in-memory engine, with the schema created, for every ConfigStore in the session."""
+
+    engine = create_async_engine(
+        "sqlite+aiosqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    await ensure_database_ready(engine=engine)
+    try:
+        yield engine
+    finally:
+        await engine.dispose()
+
+
+@pytest_asyncio.fixture(loop_scope="session")
+async def config_store(config_engine: AsyncEngine) -> AsyncIterator[ConfigStore]:
+    """Yield a ConfigStore on the session engine whose writes are rolled back after each test."""
+
+    async with config_engine.connect() as connection:
+        # pysqlite defers BEGIN until the first write, which would let the store's
+        # SAVEPOINT open (and RELEASE commit) the transaction; start it explicitly.
+        await connection.begin()
+        await connection.exec_driver_sql("BEGIN")
+        sessions = async_sessionmaker(
+            bind=connection,
+            expire_on_commit=False,
+            join_transaction_mode="create_savepoint",
+        )
+        store = ConfigStore(engine=config_engine, sessions=sessions)
+        try:
+            yield store
+        finally:
+            await store.close()
+            await connection.rollback()
+
+
 @pytest.fixture
 def clip_factory(memory_store: InMemoryStore) -> Callable[[str | None], Awaitable[ClipRecord]]:
     async def _create(filename: str | None = None) -> ClipRecord:
@@ -62,3 +135,19 @@ def analysis_payload_factory() -> Callable[..., AnalysisPayload]:
         return replace(payload, **overrides)
 
     return _factory
+
+
+@pytest.fixture
+def video_upload() -> Iterator[UploadFile]:
+    """Yield a small video upload backed by a spooled temporary file, as Starlette builds them."""
+
+    content = b"binary-video"
+    with SpooledTemporaryFile(max_size=1 << 20) as spooled:
+        spooled.write(content)
+        spooled.seek(0)
+        yield UploadFile(
+            file=spooled,  # type: ignore[arg-type]
+            filename="clip.mp4",
+            size=len(content),
+            headers=Headers({"content-type": "video/mp4"}),
+        )
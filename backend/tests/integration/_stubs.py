@@ -0,0 +1,43 @@
+from __future__ import annotations
+
+from typing import Sequence
+from uuid import UUID
+
+from backend.app.models.reasoning import ReasoningChatResponse, ReasoningHistoryResponse
+
+
+class ChatStub:
+    """Stand-in for ChatService that records calls and returns canned responses."""
+
+    def __init__(
+        self,
+        *,
+        ask_response: ReasoningChatResponse | None = None,
+        history_response: ReasoningHistoryResponse | None = None,
+    ) -> None:
+        self.ask_response = ask_response
+        self.history_response = history_response or ReasoningHistoryResponse(items=[])
+        self.chat_calls: list[tuple[list[UUID], str]] = []
+        self.history_calls: list[dict[str, object]] = []
+
+    async def ask(self, *, clips: Sequence[UUID], message: str) -> ReasoningChatResponse:
+        self.chat_calls.append((list(clips), message))
+        if self.ask_response is None:
+            raise AssertionError("ChatStub.ask called without an ask_response")
+        return self.ask_response
+
+    async def history(
+        self,
+        *,
+        clip_selection_hash: str | None = None,
+        clip_id: UUID | None = None,
+        limit: int = 20,
+    ) -> ReasoningHistoryResponse:
+        self.history_calls.append(
+            {
+                "clip_selection_hash": clip_selection_hash,
+                "clip_id": clip_id,
+                "limit": limit,
+            }
+        )
+        return self.history_response
@@ -0,0 +1,150 @@
+from __future__ import annotations
+
+import warnings
+from collections.abc import AsyncIterator, Iterator
+from pathlib import Path
+from typing import Any, NoReturn
+
+import orjson
+import pytest
+import pytest_asyncio
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient, Headers, Request, Timeout
+from pytest_asyncio import is_async_test
+
+from backend.app.api import deps
+from backend.app.db import Base, ensure_database_ready
+from backend.app.store import SqliteStore
+
+_INTEGRATION_DIR = Path(__file__).parent
+
+# One request per endpoint. During warm-up every API dependency is overridden
+# to raise _WarmupStop, so each request exercises routing, body parsing and
+# dependency resolution but never builds a real service, runs a handler or
+# reaches the request counter (which only records requests that complete).
+_WARMUP_REQUESTS: tuple[tuple[str, str, dict[str, object]], ...] = (
+    ("POST", "/api/analyze", {}),
+    ("POST", "/api/clips", {"json": {}}),
+    ("GET", "/api/clips/not-a-uuid", {}),
+    ("GET", "/api/analysis/not-a-uuid", {}),
+    ("POST", "/api/analysis/not-a-uuid", {}),
+    ("DELETE", "/api/assets/warmup-missing", {}),
+    ("POST", "/api/chat", {"json": {}}),
+    ("GET", "/api/insights", {"params": {"window": "warmup"}}),
+    ("POST", "/api/insights/share", {"json": {"window": "warmup"}}),
+    ("POST", "/api/reasoning/compare", {"json": {}}),
+    ("POST", "/api/reasoning/chat", {"json": {}}),
+)
+
+
+class _OrjsonAsyncClient(AsyncClient):
+    """AsyncClient that encodes ``json=`` request bodies with orjson."""
+
+    def build_request(self, method: str, url: Any, *, json: Any = None, **kwargs: Any) -> Request:
+        if json is not None:
+            headers = Headers(kwargs.pop("headers", None))
+            headers.setdefault("Content-Type", "application/json")
+            kwargs["headers"] = headers
+            kwargs["content"] = orjson.dumps(json)
+        return super().build_request(method, url, **kwargs)
+
+
+def pytest_collection_modifyitems(items: list[pytest.Item]) -> None:
+    """Run integration tests on the session loop that owns the shared ASGI client."""
+
+    session_loop = pytest.mark.asyncio(loop_scope="session")
+    for item in items:
+        if is_async_test(item) and item.path.is_relative_to(_INTEGRATION_DIR):
+            item.add_marker(session_loop, append=False)
+
+
+class _WarmupStop(Exception):
+    """Raised by every API dependency while the shared client is warmed up."""
+
+
+def _stop_warmup() -> NoReturn:
+    raise _WarmupStop
+
+
+async def _warm_routes(client: AsyncClient, app: FastAPI) -> None:
+    saved = app.dependency_overrides
+    app.dependency_overrides = {
+        dependency: _stop_warmup
+        for name, dependency in vars(deps).items()
+        if name.startswith("get_") and callable(dependency)
+    }
+    try:
+        for method, url, kwargs in _WARMUP_REQUESTS:
+            try:
+                response = await client.request(method, url, **kwargs)
+            except _WarmupStop:
+                continue
+            except Exception as exc:
+                # Warm-up is best effort, but a broken endpoint should still be visible.
+                warnings.warn(f"warm-up request {method} {url} failed: {exc!r}", RuntimeWarning, stacklevel=1)
+            else:
+                warnings.warn(
+                    f"warm-up request {method} {url} returned {response.status_code} "
+                    "without resolving an overridden dependency",
+                    RuntimeWarning,
+                    stacklevel=1,
+                )
+    finally:
+        app.dependency_overrides = saved
+
+
+@pytest.fixture(scope="session")
+def asgi_transport(fastapi_app: FastAPI) -> ASGITransport:
+    """Return the single ASGI transport every test client in the session routes through."""
+
+    return ASGITransport(app=fastapi_app)
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def http_client(asgi_transport: ASGITransport, fastapi_app: FastAPI) -> AsyncIterator[AsyncClient]:
+    """Yield one ASGI client for the whole session, warmed against each endpoint."""
+
+    # ASGITransport skips lifespan events, so run the app's startup and shutdown around the session.
+    # Requests never leave the process, so per-request timeout timers are wasted work.
+    async with fastapi_app.router.lifespan_context(fastapi_app), _OrjsonAsyncClient(
+        transport=asgi_transport,
+        base_url="http://testserver",
+        timeout=Timeout(None),
+    ) as client:
+        await _warm_routes(client, fastapi_app)
+        yield client
+
+
+@pytest_asyncio.fixture(scope="module", loop_scope="session")
+async def _module_sqlite_store() -> AsyncIterator[SqliteStore]:
+    store = SqliteStore.from_memory()
+    await ensure_database_ready(store.database_url)
+    try:
+        yield store
+    finally:
+        await store.close()
+
+
+@pytest_asyncio.fixture(loop_scope="session")
+async def shared_sqlite_store(_module_sqlite_store: SqliteStore) -> AsyncIterator[SqliteStore]:
+    """Yield the module's in-memory store, emptying every table after each test."""
+
+    store = _module_sqlite_store
+    try:
+        yield store
+    finally:
+        async with store.engine.begin() as connection:
+            for table in reversed(Base.metadata.sorted_tables):
+                await connection.execute(table.delete())
+
+
+@pytest.fixture(autouse=True)
+def _deps_guard(fastapi_app: FastAPI) -> Iterator[None]:
+    """Give each test empty dependency overrides and restore the previous mapping afterwards."""
+
+    saved = fastapi_app.dependency_overrides
+    fastapi_app.dependency_overrides = {}
+    try:
+        yield
+    finally:
+        fastapi_app.dependency_overrides = saved
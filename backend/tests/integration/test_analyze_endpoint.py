@@ -1,63 +1,77 @@
 import io
-import os
-from datetime import datetime
+from collections.abc import AsyncIterator
+from datetime import datetime, timezone
 from uuid import uuid4
 
 import pytest
-from fastapi import status
-from httpx import ASGITransport, AsyncClient
-
-os.environ.setdefault("HAFNIA_API_KEY", "test-key")
-os.environ.setdefault("HAFNIA_BASE_URL", "https://hafnia.example.com")
+from fastapi import FastAPI, status
+from httpx import AsyncClient
 
 from backend.app.api.deps import get_summarizer
 from backend.app.models.schemas import SummaryJson, SummaryResponse
 from backend.app.services import validators as validators_module
 from backend.app.services.hafnia_client import HafniaClientError
-from backend.main import app
+from backend.tests._helpers import assert_error, read_json
+
+_FROZEN_TS = datetime(2024, 1, 1, tzinfo=timezone.utc)
+_BOUNDARY = "clipnotes-test-boundary"
+_CHUNK_BYTES = 4096
+
+
+async def _stream_multipart_file(
+    field: str, filename: str, content_type: str, payload: bytes
+) -> AsyncIterator[bytes]:
+    """Yield a single-file multipart body in chunks instead of one buffered blob."""
+
+    yield (
+        f"--{_BOUNDARY}\r\n"
+        f'Content-Disposition: form-data; name="{field}"; filename="{filename}"\r\n'
+        f"Content-Type: {content_type}\r\n\r\n"
+    ).encode()
+    for offset in range(0, len(payload), _CHUNK_BYTES):
+        yield payload[offset : offset + _CHUNK_BYTES]
+    yield f"\r\n--{_BOUNDARY}--\r\n".encode()
 
 
 class StubSummarizer:
+    # Built once so Pydantic validation does not run on every stubbed call.
+    _response = SummaryResponse(
+        submission_id=str(uuid4()),
+        asset_id="asset-123",
+        summary=["Cyclist crosses the street", "Car stops at red light"],
+        structured_summary=SummaryJson(
+            data={
+                "events": [
+                    {"actor": "cyclist", "action": "crosses street"},
+                    {"actor": "car", "action": "stops at light"},
+                ]
+            }
+        ),
+        latency_ms=8200,
+        completed_at=_FROZEN_TS,
+        completion_id="comp-456",
+    )
+
     def __init__(self) -> None:
         self.calls = 0
 
     async def process(self, upload_file):
         self.calls += 1
-        return SummaryResponse(
-            submission_id=str(uuid4()),
-            asset_id="asset-123",
-            summary=["Cyclist crosses the street", "Car stops at red light"],
-            structured_summary=SummaryJson(
-                data={
-                    "events": [
-                        {"actor": "cyclist", "action": "crosses street"},
-                        {"actor": "car", "action": "stops at light"},
-                    ]
-                }
-            ),
-            latency_ms=8200,
-            completed_at=datetime.now(),
-            completion_id="comp-456",
-        )
+        return self._response
 
 
 @pytest.mark.asyncio
-async def test_analyze_success(monkeypatch):
+async def test_analyze_success(http_client: AsyncClient, fastapi_app: FastAPI):
     stub = StubSummarizer()
-    app.dependency_overrides[get_summarizer] = lambda: stub
-
-    async with AsyncClient(
-        transport=ASGITransport(app=app), base_url="http://testserver"
-    ) as client:
-        response = await client.post(
-            "/api/analyze",
-            files={"file": ("sample.mp4", io.BytesIO(b"video"), "video/mp4")},
-        )
+    fastapi_app.dependency_overrides[get_summarizer] = lambda: stub
 
-    app.dependency_overrides.clear()
+    response = await http_client.post(
+        "/api/analyze",
+        files={"file": ("sample.mp4", io.BytesIO(b"video"), "video/mp4")},
+    )
 
     assert response.status_code == status.HTTP_200_OK
-    payload = response.json()
+    payload = read_json(response)
     assert payload["summary"] == [
         "Cyclist crosses the street",
         "Car stops at red light",
@@ -70,79 +84,69 @@ async def test_analyze_success(monkeypatch):
 
 
 @pytest.mark.asyncio
-async def test_analyze_rejects_invalid_mime(monkeypatch):
+async def test_analyze_rejects_invalid_mime(http_client: AsyncClient, fastapi_app: FastAPI):
     stub = StubSummarizer()
-    app.dependency_overrides[get_summarizer] = lambda: stub
-
-    async with AsyncClient(
-        transport=ASGITransport(app=app), base_url="http://testserver"
-    ) as client:
-        response = await client.post(
-            "/api/analyze",
-            files={"file": ("notes.txt", io.BytesIO(b"hi"), "text/plain")},
-        )
-
-    app.dependency_overrides.clear()
-
-    assert response.status_code == status.HTTP_400_BAD_REQUEST
-    body = response.json()
-    assert body["error"]["code"] == "unsupported_file_type"
-    assert body["error"]["message"] == "Unsupported file type"
-    assert "MP4 or MKV" in body["error"].get("remediation", "")
+    fastapi_app.dependency_overrides[get_summarizer] = lambda: stub
+
+    response = await http_client.post(
+        "/api/analyze",
+        files={"file": ("notes.txt", io.BytesIO(b"hi"), "text/plain")},
+    )
+
+    assert_error(
+        response,
+        status=status.HTTP_400_BAD_REQUEST,
+        code="unsupported_file_type",
+        message="Unsupported file type",
+        remediation_contains="MP4 or MKV",
+    )
     assert stub.calls == 0
 
 
 @pytest.mark.asyncio
-async def test_analyze_rejects_large_files(monkeypatch):
+async def test_analyze_rejects_large_files(monkeypatch, http_client: AsyncClient, fastapi_app: FastAPI):
     stub = StubSummarizer()
-    app.dependency_overrides[get_summarizer] = lambda: stub
+    fastapi_app.dependency_overrides[get_summarizer] = lambda: stub
 
     monkeypatch.setattr(validators_module, "MAX_FILE_BYTES", 10)
     oversized_payload = b"0" * 12
 
-    async with AsyncClient(
-        transport=ASGITransport(app=app), base_url="http://testserver"
-    ) as client:
-        response = await client.post(
-            "/api/analyze",
-            files={
-                "file": ("huge.mp4", io.BytesIO(oversized_payload), "video/mp4"),
-            },
-        )
-
-    app.dependency_overrides.clear()
-
-    assert response.status_code == status.HTTP_400_BAD_REQUEST
-    body = response.json()
-    assert body["error"]["code"] == "file_too_large"
-    assert body["error"]["message"] == "File too large"
-    assert "Compress the clip" in body["error"].get("remediation", "")
+    response = await http_client.post(
+        "/api/analyze",
+        content=_stream_multipart_file("file", "huge.mp4", "video/mp4", oversized_payload),
+        headers={"Content-Type": f"multipart/form-data; boundary={_BOUNDARY}"},
+    )
+
+    assert_error(
+        response,
+        status=status.HTTP_400_BAD_REQUEST,
+        code="file_too_large",
+        message="File too large",
+        remediation_contains="Compress the clip",
+    )
     assert stub.calls == 0
 
 
 @pytest.mark.asyncio
-async def test_analyze_handles_hafnia_failure(monkeypatch):
+async def test_analyze_handles_hafnia_failure(http_client: AsyncClient, fastapi_app: FastAPI):
     class FailingSummarizer(StubSummarizer):
         async def process(self, upload_file):  # type: ignore[override]
             raise HafniaClientError("Hafnia timed out")
 
     stub = FailingSummarizer()
-    app.dependency_overrides[get_summarizer] = lambda: stub
-
-    async with AsyncClient(
-        transport=ASGITransport(app=app), base_url="http://testserver"
-    ) as client:
-        response = await client.post(
-            "/api/analyze",
-            files={"file": ("clip.mp4", io.BytesIO(b"video"), "video/mp4")},
-        )
-
-    app.dependency_overrides.clear()
-
-    assert response.status_code == status.HTTP_502_BAD_GATEWAY
-    payload = response.json()
-    assert payload["error"]["code"] == "hafnia_unavailable"
-    assert payload["error"]["message"] == "Hafnia is currently unavailable"
-    assert payload["error"]["detail"] == "Hafnia timed out"
-    assert "Please retry" in payload["error"].get("remediation", "")
+    fastapi_app.dependency_overrides[get_summarizer] = lambda: stub
+
+    response = await http_client.post(
+        "/api/analyze",
+        files={"file": ("clip.mp4", io.BytesIO(b"video"), "video/mp4")},
+    )
+
+    error = assert_error(
+        response,
+        status=status.HTTP_502_BAD_GATEWAY,
+        code="hafnia_unavailable",
+        message="Hafnia is currently unavailable",
+        remediation_contains="Please retry",
+    )
+    assert error.detail == "Hafnia timed out"
     assert stub.calls == 0
\ No newline at end of file
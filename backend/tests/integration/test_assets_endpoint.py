@@ -2,16 +2,14 @@ import uuid
 
 import pytest
 from fastapi import status
-from httpx import ASGITransport, AsyncClient
 
 from backend.app.api import deps
 from backend.app.services.sessions import SessionNotFoundError, SessionRegistry
 from backend.app.store import InMemoryStore
-from backend.main import app
 
 
 @pytest.mark.asyncio
-async def test_delete_asset_removes_clip_record():
+async def test_delete_asset_removes_clip_record(http_client, fastapi_app):
     registry = SessionRegistry()
     store = InMemoryStore()
 
@@ -23,13 +21,10 @@ async def test_delete_asset_removes_clip_record():
         completion_id="comp-789",
     )
 
-    app.dependency_overrides[deps.get_session_registry] = lambda: registry
-    app.dependency_overrides[deps.get_store] = lambda: store
+    fastapi_app.dependency_overrides[deps.get_session_registry] = lambda: registry
+    fastapi_app.dependency_overrides[deps.get_store] = lambda: store
 
-    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://testserver") as client:
-        response = await client.delete(f"/api/assets/{record.id}")
-
-    app.dependency_overrides.clear()
+    response = await http_client.delete(f"/api/assets/{record.id}")
 
     assert response.status_code == status.HTTP_204_NO_CONTENT
     with pytest.raises(SessionNotFoundError):
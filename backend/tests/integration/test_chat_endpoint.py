@@ -1,24 +1,18 @@
+import types
 import uuid
 
 import pytest
-from fastapi import status
-from httpx import ASGITransport, AsyncClient
+from fastapi import FastAPI, status
+from httpx import AsyncClient
 
-from backend.main import app
+from backend.tests._helpers import assert_error, read_json
 
-
-class FakeChatResult:
-    def __init__(self, submission_id: str, asset_id: str, message: str, completion_id: str | None = None) -> None:
-        self._payload = {
-            "submission_id": submission_id,
-            "asset_id": asset_id,
-            "message": message,
-        }
-        if completion_id:
-            self._payload["completion_id"] = completion_id
-
-    def model_dump(self, mode: str = "json"):
-        return self._payload
+_CHAT_PAYLOAD = {
+    "submission_id": "",
+    "asset_id": "asset-123",
+    "message": "",
+    "completion_id": "comp-789",
+}
 
 
 class StubConversationService:
@@ -26,14 +20,10 @@ class StubConversationService:
         self.reply = reply
         self.calls: list[tuple[str, str]] = []
 
-    async def chat(self, submission_id: str, prompt: str) -> FakeChatResult:
+    async def chat(self, submission_id: str, prompt: str) -> types.SimpleNamespace:
         self.calls.append((submission_id, prompt))
-        return FakeChatResult(
-            submission_id=submission_id,
-            asset_id="asset-123",
-            message=self.reply,
-            completion_id="comp-789",
-        )
+        payload = {**_CHAT_PAYLOAD, "submission_id": submission_id, "message": self.reply}
+        return types.SimpleNamespace(model_dump=lambda mode="json": payload)
 
 
 class StubConversationServiceMissing:
@@ -44,27 +34,24 @@ class StubConversationServiceMissing:
 
 
 @pytest.mark.asyncio
-async def test_chat_returns_follow_up_message(monkeypatch):
+async def test_chat_returns_follow_up_message(http_client: AsyncClient, fastapi_app: FastAPI):
     from backend.app.api import deps
 
     stub = StubConversationService(reply="Safety concerns detected.")
-    app.dependency_overrides[deps.get_conversation_service] = lambda: stub
+    fastapi_app.dependency_overrides[deps.get_conversation_service] = lambda: stub
 
     submission_id = str(uuid.uuid4())
 
-    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://testserver") as client:
-        response = await client.post(
-            "/api/chat",
-            json={
-                "submission_id": submission_id,
-                "prompt": "Highlight any safety issues",
-            },
-        )
-
-    app.dependency_overrides.clear()
+    response = await http_client.post(
+        "/api/chat",
+        json={
+            "submission_id": submission_id,
+            "prompt": "Highlight any safety issues",
+        },
+    )
 
     assert response.status_code == status.HTTP_200_OK
-    payload = response.json()
+    payload = read_json(response)
     assert payload["submission_id"] == submission_id
     assert payload["message"] == "Safety concerns detected."
     assert payload["asset_id"] == "asset-123"
@@ -73,27 +60,26 @@ async def test_chat_returns_follow_up_message(monkeypatch):
 
 
 @pytest.mark.asyncio
-async def test_chat_returns_not_found_when_submission_missing(monkeypatch):
+async def test_chat_returns_not_found_when_submission_missing(http_client: AsyncClient, fastapi_app: FastAPI):
     from backend.app.api import deps
 
     stub = StubConversationServiceMissing()
-    app.dependency_overrides[deps.get_conversation_service] = lambda: stub
+    fastapi_app.dependency_overrides[deps.get_conversation_service] = lambda: stub
 
     missing_id = str(uuid.uuid4())
 
-    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://testserver") as client:
-        response = await client.post(
-            "/api/chat",
-            json={
-                "submission_id": missing_id,
-                "prompt": "Provide a brief recap",
-            },
-        )
-
-    app.dependency_overrides.clear()
-
-    assert response.status_code == status.HTTP_404_NOT_FOUND
-    body = response.json()
-    assert body["error"]["code"] == "submission_not_found"
-    assert body["error"]["message"] == "Submission not found"
-    assert body["error"].get("submission_id") == missing_id
\ No newline at end of file
+    response = await http_client.post(
+        "/api/chat",
+        json={
+            "submission_id": missing_id,
+            "prompt": "Provide a brief recap",
+        },
+    )
+
+    error = assert_error(
+        response,
+        status=status.HTTP_404_NOT_FOUND,
+        code="submission_not_found",
+        message="Submission not found",
+    )
+    assert error.submission_id == missing_id
\ No newline at end of file
@@ -1,32 +1,22 @@
 from __future__ import annotations
 
-import os
 from uuid import UUID
 
 import pytest
 from fastapi import status
-from httpx import ASGITransport, AsyncClient
-
-os.environ.setdefault("HAFNIA_API_KEY", "test-key")
-os.environ.setdefault("HAFNIA_BASE_URL", "https://hafnia.example.com")
-os.environ.setdefault("DATABASE_URL", "memory://")
 
 from backend.app.api import deps
-from backend.main import app
+from backend.tests._helpers import assert_error, read_json
 
 
 @pytest.mark.asyncio
-async def test_register_clip_returns_pending(memory_store):
-    app.dependency_overrides[deps.get_store] = lambda: memory_store
+async def test_register_clip_returns_pending(memory_store, http_client, fastapi_app):
+    fastapi_app.dependency_overrides[deps.get_store] = lambda: memory_store
 
-    try:
-        async with AsyncClient(transport=ASGITransport(app=app), base_url="http://testserver") as client:
-            response = await client.post("/api/clips", json={"filename": "  dock.mp4  "})
-    finally:
-        app.dependency_overrides.clear()
+    response = await http_client.post("/api/clips", json={"filename": "  dock.mp4  "})
 
     assert response.status_code == status.HTTP_201_CREATED
-    payload = response.json()
+    payload = read_json(response)
 
     clip_id = UUID(payload["clip_id"])
     assert payload["filename"] == "dock.mp4"
@@ -39,36 +29,30 @@ async def test_register_clip_returns_pending(memory_store):
 
 
 @pytest.mark.asyncio
-async def test_register_clip_validates_filename(memory_store):
-    app.dependency_overrides[deps.get_store] = lambda: memory_store
+async def test_register_clip_validates_filename(memory_store, http_client, fastapi_app):
+    fastapi_app.dependency_overrides[deps.get_store] = lambda: memory_store
 
-    try:
-        async with AsyncClient(transport=ASGITransport(app=app), base_url="http://testserver") as client:
-            response = await client.post("/api/clips", json={"filename": "   "})
-    finally:
-        app.dependency_overrides.clear()
+    response = await http_client.post("/api/clips", json={"filename": "   "})
 
-    assert response.status_code == status.HTTP_400_BAD_REQUEST
-    payload = response.json()
-    assert payload["error"]["code"] == "invalid_filename"
-    assert "Filename is required" in payload["error"]["message"]
+    assert_error(
+        response,
+        status=status.HTTP_400_BAD_REQUEST,
+        code="invalid_filename",
+        message_contains="Filename is required",
+    )
 
 
 @pytest.mark.asyncio
-async def test_list_clips_returns_recent_items(memory_store):
+async def test_list_clips_returns_recent_items(memory_store, http_client, fastapi_app):
     first = await memory_store.create_clip(filename="harbor.mp4")
     second = await memory_store.create_clip(filename="crosswalk.mp4")
 
-    app.dependency_overrides[deps.get_store] = lambda: memory_store
+    fastapi_app.dependency_overrides[deps.get_store] = lambda: memory_store
 
-    try:
-        async with AsyncClient(transport=ASGITransport(app=app), base_url="http://testserver") as client:
-            response = await client.get("/api/clips")
-    finally:
-        app.dependency_overrides.clear()
+    response = await http_client.get("/api/clips")
 
     assert response.status_code == status.HTTP_200_OK
-    payload = response.json()
+    payload = read_json(response)
 
     items = payload["items"]
     assert len(items) == 2
@@ -78,19 +62,15 @@ async def test_list_clips_returns_recent_items(memory_store):
 
 
 @pytest.mark.asyncio
-async def test_get_clip_returns_detail(memory_store):
+async def test_get_clip_returns_detail(memory_store, http_client, fastapi_app):
     record = await memory_store.create_clip(filename="bridge.mp4")
 
-    app.dependency_overrides[deps.get_store] = lambda: memory_store
+    fastapi_app.dependency_overrides[deps.get_store] = lambda: memory_store
 
-    try:
-        async with AsyncClient(transport=ASGITransport(app=app), base_url="http://testserver") as client:
-            response = await client.get(f"/api/clips/{record.id}")
-    finally:
-        app.dependency_overrides.clear()
+    response = await http_client.get(f"/api/clips/{record.id}")
 
     assert response.status_code == status.HTTP_200_OK
-    payload = response.json()
+    payload = read_json(response)
     assert payload["clip"]["clip_id"] == str(record.id)
     assert payload["clip"]["filename"] == "bridge.mp4"
     assert payload["analysis"] is None
@@ -3,43 +3,46 @@ from __future__ import annotations
 from datetime import datetime, timezone
 
 import pytest
-from fastapi import status
-from httpx import ASGITransport, AsyncClient
+from fastapi import FastAPI, status
+from httpx import AsyncClient
 from sqlalchemy import select
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
 from backend.app.api import deps
 from backend.app.models.config import RequestCountModel
 from backend.app.services.metrics_service import MetricsService
 from backend.app.store.base import AnalysisPayload, Moment
 from backend.app.store.sqlite import AnalysisModel, SqliteStore
-from backend.main import app
+from backend.tests._helpers import read_json
 
 
 @pytest.mark.asyncio
-async def test_metrics_endpoint_returns_snapshot(tmp_path) -> None:
-    database_url = f"sqlite+aiosqlite:///{tmp_path/'metrics.db'}"
-    store = SqliteStore(database_url)
-    metrics_service = MetricsService(database_url, latency_warning_threshold_ms=5000)
+async def test_metrics_endpoint_returns_snapshot(
+    shared_sqlite_store: SqliteStore, http_client: AsyncClient, fastapi_app: FastAPI
+) -> None:
+    store = shared_sqlite_store
+    metrics_service = MetricsService(store.database_url, latency_warning_threshold_ms=5000)
 
-    app.dependency_overrides[deps.get_store] = lambda: store
-    app.dependency_overrides[deps.get_metrics_service] = lambda: metrics_service
+    fastapi_app.dependency_overrides[deps.get_store] = lambda: store
+    fastapi_app.dependency_overrides[deps.get_metrics_service] = lambda: metrics_service
 
     now = datetime(2025, 11, 3, 15, 0, tzinfo=timezone.utc)
 
-    clip = await store.create_clip(filename="demo.mp4")
-    await store.save_analysis(
-        clip.id,
-        AnalysisPayload(
-            summary="ok",
-            moments=[Moment(start_s=0.0, end_s=1.0, label="intro", severity="low")],
-            raw={},
-            latency_ms=6400,
-        ),
+    await store.bulk_seed(
+        [
+            (
+                "demo.mp4",
+                AnalysisPayload(
+                    summary="ok",
+                    moments=[Moment(start_s=0.0, end_s=1.0, label="intro", severity="low")],
+                    raw={},
+                    latency_ms=6400,
+                ),
+            )
+        ]
     )
 
-    engine = create_async_engine(database_url, echo=False)
-    sessions: async_sessionmaker[AsyncSession] = async_sessionmaker(engine, expire_on_commit=False)
+    sessions: async_sessionmaker[AsyncSession] = async_sessionmaker(store.engine, expire_on_commit=False)
 
     async with sessions() as session:
         analysis = (await session.execute(select(AnalysisModel))).scalars().first()
@@ -49,32 +52,27 @@ async def test_metrics_endpoint_returns_snapshot(tmp_path) -> None:
         await session.commit()
 
     try:
-        async with AsyncClient(transport=ASGITransport(app=app), base_url="http://testserver") as client:
-            response = await client.get("/api/metrics")
+        response = await http_client.get("/api/metrics")
     finally:
-        app.dependency_overrides.clear()
         await metrics_service.close()
-        await store.close()
-        await engine.dispose()
 
     assert response.status_code == status.HTTP_200_OK
 
 
 @pytest.mark.asyncio
-async def test_metrics_endpoint_rejects_invalid_window(tmp_path) -> None:
-    database_url = f"sqlite+aiosqlite:///{tmp_path/'invalid-window.db'}"
-    metrics_service = MetricsService(database_url)
+async def test_metrics_endpoint_rejects_invalid_window(
+    shared_sqlite_store: SqliteStore, http_client: AsyncClient, fastapi_app: FastAPI
+) -> None:
+    metrics_service = MetricsService(shared_sqlite_store.database_url)
 
-    app.dependency_overrides[deps.get_metrics_service] = lambda: metrics_service
+    fastapi_app.dependency_overrides[deps.get_metrics_service] = lambda: metrics_service
 
     try:
-        async with AsyncClient(transport=ASGITransport(app=app), base_url="http://testserver") as client:
-            response = await client.get("/api/metrics?window=1h")
+        response = await http_client.get("/api/metrics?window=1h")
     finally:
-        app.dependency_overrides.clear()
         await metrics_service.close()
 
     assert response.status_code == status.HTTP_400_BAD_REQUEST
-    payload = response.json()
+    payload = read_json(response)
     assert payload["error"]["code"] == "invalid_window"
     assert "invalid" in payload["error"]["message"].lower()
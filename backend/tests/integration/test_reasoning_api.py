@@ -4,11 +4,10 @@ from __future__ import annotations
 
 from datetime import datetime, timezone
 from typing import Callable, cast
-from uuid import UUID, uuid4
+from uuid import UUID
 
 import pytest
 from fastapi import status
-from httpx import ASGITransport, AsyncClient
 
 from backend.app.models.reasoning import (
 	ComparisonAnswer,
@@ -18,11 +17,14 @@ from backend.app.models.reasoning import (
 	ReasoningHistoryResponse,
 )
 from backend.app.store.base import AnalysisRecord, ClipRecord, Moment
-from backend.main import app
+from backend.tests._helpers import read_json, tuid
+from backend.tests.integration._stubs import ChatStub
+
+NOW = datetime(2025, 1, 1, 12, 0, tzinfo=timezone.utc)
 
 
 @pytest.mark.asyncio
-async def test_compare_two_clips(monkeypatch):
+async def test_compare_two_clips(http_client, fastapi_app):
 	from backend.app.api import deps
 
 	class StubCompareService:
@@ -45,150 +47,100 @@ async def test_compare_two_clips(monkeypatch):
 	compare_provider = cast(Callable[[], object], compare_dependency)
 
 	stub = StubCompareService()
-	app.dependency_overrides[compare_provider] = lambda: stub
-
-	clip_a = uuid4()
-	clip_b = uuid4()
-
-	async with AsyncClient(transport=ASGITransport(app=app), base_url="http://testserver") as client:
-		response = await client.post(
-			"/api/reasoning/compare",
-			json={
-				"clip_a": str(clip_a),
-				"clip_b": str(clip_b),
-				"question": "Which clip is riskier?",
-			},
-		)
-
-	app.dependency_overrides.clear()
+	fastapi_app.dependency_overrides[compare_provider] = lambda: stub
+
+	clip_a = tuid()
+	clip_b = tuid()
+
+	response = await http_client.post(
+		"/api/reasoning/compare",
+		json={
+			"clip_a": str(clip_a),
+			"clip_b": str(clip_b),
+			"question": "Which clip is riskier?",
+		},
+	)
 
 	assert response.status_code == status.HTTP_200_OK
-	payload = response.json()
+	payload = read_json(response)
 	assert payload["answer"] == ComparisonAnswer.CLIP_A.value
 	assert stub.calls == [(clip_a, clip_b, "Which clip is riskier?")]
 
 
 @pytest.mark.asyncio
-async def test_chat_follow_up_endpoint(monkeypatch):
+async def test_chat_follow_up_endpoint(http_client, fastapi_app):
 	from backend.app.api import deps
 
-	clip_a = uuid4()
-	clip_b = uuid4()
-
-	class StubChatService:
-		def __init__(self) -> None:
-			self.chat_calls: list[tuple[list[UUID], str]] = []
-			self.history_calls: list[dict[str, object]] = []
-
-		async def ask(self, *, clips, message):
-			self.chat_calls.append((clips, message))
-			return ReasoningChatResponse(
-				answer="Clip B shows reduced congestion.",
-				created_at=datetime.now(timezone.utc),
-				evidence=[],
-				clips=[clip_a, clip_b],
-			)
-
-		async def history(self, *, clip_selection_hash=None, clip_id=None, limit=20):  # pragma: no cover - unused here
-			self.history_calls.append(
-				{
-					"clip_selection_hash": clip_selection_hash,
-					"clip_id": clip_id,
-					"limit": limit,
-				}
-			)
-			return ReasoningHistoryResponse(items=[])
+	clip_a = tuid()
+	clip_b = tuid()
 
 	chat_dependency = getattr(deps, "get_chat_service", None)
 	if chat_dependency is None:
 		pytest.skip("chat service dependency not wired yet")
 	chat_provider = cast(Callable[[], object], chat_dependency)
 
-	stub = StubChatService()
-	app.dependency_overrides[chat_provider] = lambda: stub
-
-	async with AsyncClient(transport=ASGITransport(app=app), base_url="http://testserver") as client:
-		response = await client.post(
-			"/api/reasoning/chat",
-			json={
-				"clips": [str(clip_a), str(clip_b)],
-				"message": "Where is congestion lower now?",
-			},
+	stub = ChatStub(
+		ask_response=ReasoningChatResponse(
+			answer="Clip B shows reduced congestion.",
+			created_at=NOW,
+			evidence=[],
+			clips=[clip_a, clip_b],
 		)
-
-	app.dependency_overrides.clear()
+	)
+	fastapi_app.dependency_overrides[chat_provider] = lambda: stub
+
+	response = await http_client.post(
+		"/api/reasoning/chat",
+		json={
+			"clips": [str(clip_a), str(clip_b)],
+			"message": "Where is congestion lower now?",
+		},
+	)
 
 	assert response.status_code == status.HTTP_200_OK
-	payload = response.json()
+	payload = read_json(response)
 	assert payload["answer"] == "Clip B shows reduced congestion."
 	assert stub.chat_calls == [([clip_a, clip_b], "Where is congestion lower now?")]
 
 
 @pytest.mark.asyncio
-async def test_history_endpoint_returns_entries(monkeypatch):
+async def test_history_endpoint_returns_entries(http_client, fastapi_app):
 	from backend.app.api import deps
 
-	clip_id = uuid4()
+	clip_id = tuid()
 	entry = ReasoningHistoryEntry(
-		id=uuid4(),
+		id=tuid(),
 		clip_ids=[clip_id],
 		question="Any changes after the second pass?",
 		answer=ReasoningChatResponse(
 			answer="Clip shows marginal improvement near dock.",
-			created_at=datetime.now(timezone.utc),
+			created_at=NOW,
 			evidence=[],
 			clips=[clip_id],
 		),
 		answer_type="chat",
-		created_at=datetime.now(timezone.utc),
+		created_at=NOW,
 	)
 
-	class StubChatService:
-		def __init__(self) -> None:
-			self.chat_calls: list[tuple[list[UUID], str]] = []
-			self.history_calls: list[dict[str, object]] = []
-
-		async def ask(self, *, clips, message):  # pragma: no cover - unused here
-			self.chat_calls.append((clips, message))
-			return ReasoningChatResponse(
-				answer="",
-				created_at=datetime.now(timezone.utc),
-				evidence=[],
-				clips=list(clips),
-			)
-
-		async def history(self, *, clip_selection_hash=None, clip_id=None, limit=20):
-			self.history_calls.append(
-				{
-					"clip_selection_hash": clip_selection_hash,
-					"clip_id": clip_id,
-					"limit": limit,
-				}
-			)
-			return ReasoningHistoryResponse(items=[entry])
-
 	chat_dependency = getattr(deps, "get_chat_service", None)
 	if chat_dependency is None:
 		pytest.skip("chat service dependency not wired yet")
 	chat_provider = cast(Callable[[], object], chat_dependency)
 
-	stub = StubChatService()
-	app.dependency_overrides[chat_provider] = lambda: stub
-
-	async with AsyncClient(transport=ASGITransport(app=app), base_url="http://testserver") as client:
-		response = await client.get(
-			"/api/reasoning/history",
-			params={
-				"clip_selection_hash": "selection:abc",
-				"clip_id": str(clip_id),
-				"limit": 5,
-			},
-		)
+	stub = ChatStub(history_response=ReasoningHistoryResponse(items=[entry]))
+	fastapi_app.dependency_overrides[chat_provider] = lambda: stub
 
-	app.dependency_overrides.clear()
+	response = await http_client.get(
+		"/api/reasoning/history",
+		params={
+			"clip_selection_hash": "selection:abc",
+			"clip_id": str(clip_id),
+			"limit": 5,
+		},
+	)
 
 	assert response.status_code == status.HTTP_200_OK
-	payload = response.json()
+	payload = read_json(response)
 	assert payload["items"], "Expected at least one history item"
 	assert payload["items"][0]["question"] == "Any changes after the second pass?"
 	assert stub.history_calls == [
@@ -201,10 +153,10 @@ async def test_history_endpoint_returns_entries(monkeypatch):
 
 
 @pytest.mark.asyncio
-async def test_metrics_payload(monkeypatch):
+async def test_metrics_payload(http_client, fastapi_app):
 	from backend.app.api import deps
 
-	clip_id = uuid4()
+	clip_id = tuid()
 
 	class StubStore:
 		def __init__(self) -> None:
@@ -215,7 +167,7 @@ async def test_metrics_payload(monkeypatch):
 				id=clip,
 				filename="metrics.mp4",
 				asset_id="asset-1",
-				created_at=datetime.now(timezone.utc),
+				created_at=NOW,
 			)
 
 		async def get_latest_analysis(self, clip: UUID) -> AnalysisRecord | None:
@@ -238,7 +190,7 @@ async def test_metrics_payload(monkeypatch):
 						],
 					}
 				},
-				created_at=datetime.now(timezone.utc),
+				created_at=NOW,
 				latency_ms=900,
 				prompt=None,
 				error_code=None,
@@ -251,15 +203,12 @@ async def test_metrics_payload(monkeypatch):
 
 	stub = StubStore()
 	store_provider = cast(Callable[[], object], store_dependency)
-	app.dependency_overrides[store_provider] = lambda: stub
-
-	async with AsyncClient(transport=ASGITransport(app=app), base_url="http://testserver") as client:
-		response = await client.get(f"/api/reasoning/metrics/{clip_id}")
+	fastapi_app.dependency_overrides[store_provider] = lambda: stub
 
-	app.dependency_overrides.clear()
+	response = await http_client.get(f"/api/reasoning/metrics/{clip_id}")
 
 	assert response.status_code == status.HTTP_200_OK
-	payload = response.json()
+	payload = read_json(response)
 	assert payload["clip_id"] == str(clip_id)
 	assert payload["counts_by_label"]["collision"] == 1
 	assert payload["durations_by_label"]["berthing"] == 4.5
@@ -267,10 +216,10 @@ async def test_metrics_payload(monkeypatch):
 
 
 @pytest.mark.asyncio
-async def test_metrics_payload_returns_not_found_when_analysis_missing(monkeypatch):
+async def test_metrics_payload_returns_not_found_when_analysis_missing(http_client, fastapi_app):
 	from backend.app.api import deps
 
-	clip_id = uuid4()
+	clip_id = tuid()
 
 	class EmptyStore:
 		def __init__(self) -> None:
@@ -281,7 +230,7 @@ async def test_metrics_payload_returns_not_found_when_analysis_missing(monkeypat
 				id=clip,
 				filename="metrics.mp4",
 				asset_id="asset-1",
-				created_at=datetime.now(timezone.utc),
+				created_at=NOW,
 			)
 
 		async def get_latest_analysis(self, clip: UUID) -> AnalysisRecord | None:  # pragma: no cover - trivial branch
@@ -294,13 +243,10 @@ async def test_metrics_payload_returns_not_found_when_analysis_missing(monkeypat
 
 	stub = EmptyStore()
 	store_provider = cast(Callable[[], object], store_dependency)
-	app.dependency_overrides[store_provider] = lambda: stub
-
-	async with AsyncClient(transport=ASGITransport(app=app), base_url="http://testserver") as client:
-		response = await client.get(f"/api/reasoning/metrics/{clip_id}")
+	fastapi_app.dependency_overrides[store_provider] = lambda: stub
 
-	app.dependency_overrides.clear()
+	response = await http_client.get(f"/api/reasoning/metrics/{clip_id}")
 
 	assert response.status_code == status.HTTP_404_NOT_FOUND
-	payload = response.json()
+	payload = read_json(response)
 	assert payload["error"]["code"] == "analysis_not_found"
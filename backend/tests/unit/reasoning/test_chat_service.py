@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from datetime import datetime, timezone
 from typing import Any, Sequence, cast
-from uuid import UUID, uuid4
+from uuid import UUID
 
 import pytest
 
@@ -15,6 +15,9 @@ from backend.app.reasoning.chat import (
 from backend.app.reasoning.compare import MissingAnalysisError
 from backend.app.reasoning.store import ReasoningHistoryRecord
 from backend.app.store.base import AnalysisRecord, ClipStore, Moment
+from backend.tests._helpers import tuid
+
+NOW = datetime(2025, 1, 1, 12, 0, tzinfo=timezone.utc)
 
 
 def _make_analysis(
@@ -24,11 +27,11 @@ def _make_analysis(
     moments: list[Moment] | None = None,
 ) -> AnalysisRecord:
     return AnalysisRecord(
-        clip_id=clip_id or uuid4(),
+        clip_id=clip_id or tuid(),
         summary=summary,
         moments=moments or [],
         raw={"moments": []},
-        created_at=datetime.now(timezone.utc),
+        created_at=NOW,
         latency_ms=1200,
         prompt="system",
         error_code=None,
@@ -38,20 +41,30 @@ def _make_analysis(
 
 class _StubStore:
     def __init__(self, analyses: dict[UUID, AnalysisRecord]):
-        self._analyses = analyses
+        # Tests hold a handful of clips, so a linear scan is cheaper than hashing UUIDs.
+        self._items = tuple(analyses.items())
         self.requested: list[UUID] = []
 
     async def get_latest_analysis(self, clip_id: UUID) -> AnalysisRecord | None:
         self.requested.append(clip_id)
-        return self._analyses.get(clip_id)
+        for stored_id, record in self._items:
+            if stored_id == clip_id:
+                return record
+        return None
 
 
 class _StubHistoryStore:
     def __init__(self) -> None:
         self.persist_calls: list[ReasoningHistoryRecord] = []
         self.history: dict[str, list[ReasoningHistoryRecord]] = {}
+        self._by_clip: dict[UUID, list[ReasoningHistoryRecord]] = {}
         self.list_args: list[dict[str, Any]] = []
 
+    def seed(self, record: ReasoningHistoryRecord) -> None:
+        self.history.setdefault(record.clip_selection_hash, []).append(record)
+        for clip_id in record.clip_ids:
+            self._by_clip.setdefault(clip_id, []).append(record)
+
     async def list_recent(
         self,
         *,
@@ -71,12 +84,7 @@ class _StubHistoryStore:
             return list(self.history.get(clip_selection_hash, []))[:limit]
 
         if clip_id is not None:
-            matches: list[ReasoningHistoryRecord] = []
-            for entries in self.history.values():
-                matches.extend(
-                    entry for entry in entries if clip_id in entry.clip_ids
-                )
-            return matches[:limit]
+            return self._by_clip.get(clip_id, [])[:limit]
 
         return []
 
@@ -90,16 +98,16 @@ class _StubHistoryStore:
         answer_type: str,
     ) -> ReasoningHistoryRecord:
         record = ReasoningHistoryRecord(
-            id=uuid4(),
+            id=tuid(),
             clip_selection_hash=clip_selection_hash,
             clip_ids=list(clip_ids),
             question=question,
             answer=answer,
             answer_type=answer_type,
-            created_at=datetime.now(timezone.utc),
+            created_at=NOW,
         )
         self.persist_calls.append(record)
-        self.history.setdefault(clip_selection_hash, []).append(record)
+        self.seed(record)
         return record
 
 
@@ -118,7 +126,7 @@ class _StubReasoningClient:
 
 
 def test_compute_clip_selection_hash_is_order_invariant():
-    clip_ids = [uuid4(), uuid4(), uuid4()]
+    clip_ids = [tuid(), tuid(), tuid()]
     forward = compute_clip_selection_hash(clip_ids)
     backward = compute_clip_selection_hash(list(reversed(clip_ids)))
     assert forward == backward
@@ -135,7 +143,7 @@ async def test_chat_service_persists_entry_and_returns_response():
     client = _StubReasoningClient(
         {
             "answer": "Clip A remains riskier due to repeated high severity events.",
-            "created_at": datetime.now(timezone.utc).isoformat(),
+            "created_at": NOW.isoformat(),
             "clips": [str(clip_a.clip_id), str(clip_b.clip_id)],
             "evidence": [
                 {
@@ -183,27 +191,27 @@ async def test_chat_service_includes_history_in_prompt():
     history_store = _StubHistoryStore()
     existing_response = ReasoningChatResponse(
         answer="Clip shows continued congestion near dockyard.",
-        created_at=datetime.now(timezone.utc),
+        created_at=NOW,
         evidence=[],
         clips=[clip.clip_id],
     )
     selection_hash = compute_clip_selection_hash([clip.clip_id])
-    history_store.history[selection_hash] = [
+    history_store.seed(
         ReasoningHistoryRecord(
-            id=uuid4(),
+            id=tuid(),
             clip_selection_hash=selection_hash,
             clip_ids=[clip.clip_id],
             question="What changed after noon?",
             answer=existing_response,
             answer_type="chat",
-            created_at=datetime.now(timezone.utc),
+            created_at=NOW,
         )
-    ]
+    )
 
     client = _StubReasoningClient(
         {
             "answer": "Conditions remain similar with minor delays.",
-            "created_at": datetime.now(timezone.utc).isoformat(),
+            "created_at": NOW.isoformat(),
             "clips": [str(clip.clip_id)],
         }
     )
@@ -228,7 +236,7 @@ async def test_chat_service_requires_analysis_for_each_clip():
     clip_a = _make_analysis()
     store = _StubStore({clip_a.clip_id: clip_a})
     history_store = _StubHistoryStore()
-    client = _StubReasoningClient({"answer": "", "created_at": datetime.now(timezone.utc).isoformat()})
+    client = _StubReasoningClient({"answer": "", "created_at": NOW.isoformat()})
 
     service = ChatService(
         store=cast(ClipStore, store),
@@ -236,6 +244,6 @@ async def test_chat_service_requires_analysis_for_each_clip():
         client=client,
     )
 
-    missing_clip = uuid4()
+    missing_clip = tuid()
     with pytest.raises(MissingAnalysisError):
         await service.ask(clips=[clip_a.clip_id, missing_clip], message="Are both clips similar?")
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from datetime import datetime, timezone
 from typing import cast
-from uuid import UUID, uuid4
+from uuid import UUID
 
 import pytest
 
@@ -16,6 +16,7 @@ from backend.app.reasoning.compare import (
     normalize_compare_response,
 )
 from backend.app.store.base import AnalysisRecord, ClipStore, Moment
+from backend.tests._helpers import tuid
 
 
 def _make_analysis(
@@ -25,7 +26,7 @@ def _make_analysis(
     moments: list[Moment] | None = None,
 ) -> AnalysisRecord:
     return AnalysisRecord(
-        clip_id=clip_id or uuid4(),
+        clip_id=clip_id or tuid(),
         summary=summary,
         moments=moments or [],
         raw={"moments": []},
@@ -68,8 +69,8 @@ def test_build_compare_prompt_includes_clip_details():
 
 
 def test_normalize_compare_response_parses_payload():
-    clip_a_id = uuid4()
-    clip_b_id = uuid4()
+    clip_a_id = tuid()
+    clip_b_id = tuid()
 
     result = normalize_compare_response(
         {
@@ -108,7 +109,7 @@ def test_normalize_compare_response_parses_payload():
 
 
 def test_normalize_compare_response_handles_string_timestamps():
-    clip_b_id = uuid4()
+    clip_b_id = tuid()
 
     result = normalize_compare_response(
         {
@@ -133,7 +134,7 @@ def test_normalize_compare_response_handles_string_timestamps():
 
 
 def test_normalize_compare_response_handles_invalid_payload():
-    clip_a_id = uuid4()
+    clip_a_id = tuid()
 
     result = normalize_compare_response(
         {
@@ -229,7 +230,7 @@ async def test_compare_service_returns_normalized_response():
     assert "Clip A (clip_id=" in prompt
     assert "Question: Which clip has more severe incidents?" in prompt
 
-    assert store.requested == [clip_a.clip_id, clip_b.clip_id]
+    assert set(store.requested) == {clip_a.clip_id, clip_b.clip_id}
 
 
 @pytest.mark.asyncio
@@ -239,7 +240,7 @@ async def test_compare_service_requires_analysis_for_each_clip():
     client = _StubClient({})
     service = CompareService(store=cast(ClipStore, store), client=client)
 
-    missing_clip = uuid4()
+    missing_clip = tuid()
     with pytest.raises(MissingAnalysisError) as exc:
         await service.compare(
             clip_a_id=clip_a.clip_id,
@@ -253,7 +254,7 @@ async def test_compare_service_requires_analysis_for_each_clip():
 
 @pytest.mark.asyncio
 async def test_compare_service_blocks_duplicate_clip_selection():
-    clip_id = uuid4()
+    clip_id = tuid()
     clip_analysis = _make_analysis(clip_id=clip_id)
     store = _StubStore({clip_id: clip_analysis})
     client = _StubClient({})
@@ -1,47 +1,21 @@
 from __future__ import annotations
 
-from typing import cast
+from typing import Any, cast
 
-import pytest
 import httpx
+import orjson
+import pytest
 from pydantic import HttpUrl
 
 from backend.app.core.config import Settings
 from backend.app.reasoning.client import HafniaReasoningClient
 
 
-class _StubResponse:
-    def __init__(self, payload):
-        self._payload = payload
-
-    def raise_for_status(self) -> None:
-        return None
-
-    def json(self):
-        return self._payload
-
-
-class _StubAsyncClient:
-    def __init__(self, response):
-        self._response = response
-
-    async def __aenter__(self):
-        return self
+def _choices(content: Any) -> dict[str, Any]:
+    return {"choices": [{"message": {"content": content}}]}
 
-    async def __aexit__(self, exc_type, exc, tb):
-        return False
 
-    async def post(self, *_args, **_kwargs):
-        return self._response
-
-
-@pytest.mark.asyncio
-async def test_reasoning_client_parses_output_text_with_relaxed_json(monkeypatch):
-    settings = Settings(
-        hafnia_api_key="test-key",
-        hafnia_base_url=cast(HttpUrl, "https://example.com"),
-    )
-    text = """
+_RELAXED_JSON_TEXT = """
     {
       "answer": "clip_a",
       "explanation": "Clip A prevails.",
@@ -51,143 +25,71 @@ async def test_reasoning_client_parses_output_text_with_relaxed_json(monkeypatch
       "confidence": 0.9,
     }
     """
-    response_payload = {
-        "choices": [
-            {
-                "message": {
-                    "content": [
-                        {"type": "output_text", "text": text},
-                    ]
-                }
-            }
-        ]
-    }
-    stub = _StubResponse(response_payload)
-    monkeypatch.setattr(
-        httpx,
-        "AsyncClient",
-        lambda *args, **kwargs: _StubAsyncClient(stub),
-    )
-
-    client = HafniaReasoningClient(settings=settings)
-    result = await client.request_reasoning(system_prompt="prompt", prompt="question")
 
-    assert result["answer"] == "clip_a"
-    assert result["explanation"] == "Clip A prevails."
-    assert result["confidence"] == 0.9
 
-
-@pytest.mark.asyncio
-async def test_reasoning_client_returns_uncertain_when_no_text(monkeypatch):
-    settings = Settings(
+@pytest.fixture(scope="module")
+def settings() -> Settings:
+    return Settings(
         hafnia_api_key="test-key",
         hafnia_base_url=cast(HttpUrl, "https://example.com"),
     )
-    response_payload = {
-        "choices": [
-            {
-                "message": {
-                    "content": [
-                        {"type": "image", "image_url": "https://example.com/asset.png"},
-                    ]
-                }
-            }
-        ]
-    }
-    stub = _StubResponse(response_payload)
-    monkeypatch.setattr(
-        httpx,
-        "AsyncClient",
-        lambda *args, **kwargs: _StubAsyncClient(stub),
-    )
-
-    client = HafniaReasoningClient(settings=settings)
-    result = await client.request_reasoning(system_prompt="prompt", prompt="question")
-
-    assert result["answer"] == "uncertain"
-    assert "interpretable" in result["explanation"].lower()
-    assert result["evidence"] == []
-    assert result["confidence"] == 0.0
 
 
 @pytest.mark.asyncio
-async def test_reasoning_client_parses_string_content(monkeypatch):
-    settings = Settings(
-        hafnia_api_key="test-key",
-        hafnia_base_url=cast(HttpUrl, "https://example.com"),
-    )
-    response_payload = {
-        "choices": [
+@pytest.mark.parametrize(
+    ("response_payload", "expected"),
+    [
+        pytest.param(
+            _choices([{"type": "output_text", "text": _RELAXED_JSON_TEXT}]),
+            {"answer": "clip_a", "explanation": "Clip A prevails.", "confidence": 0.9},
+            id="output-text-relaxed-json",
+        ),
+        pytest.param(
+            _choices([{"type": "image", "image_url": "https://example.com/asset.png"}]),
             {
-                "message": {
-                    "content": "{\n                        \"answer\": \"clip_b\",\n                        \"explanation\": \"Structured string content.\",\n                        \"evidence\": [],\n                        \"confidence\": 0.7\n                    }",
-                }
-            }
-        ]
-    }
-    stub = _StubResponse(response_payload)
-    monkeypatch.setattr(
-        httpx,
-        "AsyncClient",
-        lambda *args, **kwargs: _StubAsyncClient(stub),
-    )
-
-    client = HafniaReasoningClient(settings=settings)
-    result = await client.request_reasoning(system_prompt="prompt", prompt="question")
-
-    assert result["answer"] == "clip_b"
-    assert result["explanation"] == "Structured string content."
-    assert result["confidence"] == 0.7
-
-
-@pytest.mark.asyncio
-async def test_reasoning_client_handles_top_level_string(monkeypatch):
-    settings = Settings(
-        hafnia_api_key="test-key",
-        hafnia_base_url=cast(HttpUrl, "https://example.com"),
-    )
-    payload = """
+                "answer": "uncertain",
+                "explanation": (
+                    "Reasoning service did not return an interpretable answer. Please retry the request."
+                ),
+                "evidence": [],
+                "confidence": 0.0,
+            },
+            id="uncertain-without-text",
+        ),
+        pytest.param(
+            _choices(
+                "{\n                        \"answer\": \"clip_b\",\n                        \"explanation\": \"Structured string content.\",\n                        \"evidence\": [],\n                        \"confidence\": 0.7\n                    }"
+            ),
+            {"answer": "clip_b", "explanation": "Structured string content.", "confidence": 0.7},
+            id="string-content",
+        ),
+        pytest.param(
+            """
     {"answer": "clip_c", "explanation": "Top level string", "evidence": [], "confidence": 0.55}
-    """
-    stub = _StubResponse(payload)
-    monkeypatch.setattr(
-        httpx,
-        "AsyncClient",
-        lambda *args, **kwargs: _StubAsyncClient(stub),
-    )
-
-    client = HafniaReasoningClient(settings=settings)
-    result = await client.request_reasoning(system_prompt="prompt", prompt="question")
-
-    assert result["answer"] == "clip_c"
-    assert result["confidence"] == 0.55
-
-
-@pytest.mark.asyncio
-async def test_reasoning_client_parses_structured_text(monkeypatch):
-    settings = Settings(
-        hafnia_api_key="test-key",
-        hafnia_base_url=cast(HttpUrl, "https://example.com"),
-    )
-    response_payload = {
-        "choices": [
+    """,
+            {"answer": "clip_c", "confidence": 0.55},
+            id="top-level-string",
+        ),
+        pytest.param(
+            _choices("Answer: Clip B\nExplanation: Clip B shows more sustained activity.\nConfidence: 78%"),
             {
-                "message": {
-                    "content": "Answer: Clip B\nExplanation: Clip B shows more sustained activity.\nConfidence: 78%",
-                }
-            }
-        ]
-    }
-    stub = _StubResponse(response_payload)
-    monkeypatch.setattr(
-        httpx,
-        "AsyncClient",
-        lambda *args, **kwargs: _StubAsyncClient(stub),
-    )
-
-    client = HafniaReasoningClient(settings=settings)
+                "answer": "clip_b",
+                "explanation": "Clip B shows more sustained activity.",
+                "confidence": pytest.approx(0.78, rel=1e-2),
+            },
+            id="structured-text",
+        ),
+    ],
+)
+async def test_reasoning_client_parses_response(
+    settings: Settings,
+    response_payload: Any,
+    expected: dict[str, Any],
+) -> None:
+    body = orjson.dumps(response_payload)
+    transport = httpx.MockTransport(lambda request: httpx.Response(200, content=body))
+
+    client = HafniaReasoningClient(settings=settings, transport=transport)
     result = await client.request_reasoning(system_prompt="prompt", prompt="question")
 
-    assert result["answer"] == "clip_b"
-    assert "sustained activity" in result["explanation"]
-    assert pytest.approx(result["confidence"], rel=1e-2) == 0.78
+    assert {key: result[key] for key in expected} == expected
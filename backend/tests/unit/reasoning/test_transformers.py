@@ -1,16 +1,16 @@
 from __future__ import annotations
 
 from datetime import datetime, timezone
-from uuid import uuid4
 
 import pytest
 
 from backend.app.reasoning.transformers import summarize_clip_metrics
 from backend.app.store.base import AnalysisRecord, Moment
+from backend.tests._helpers import tuid
 
 
 def _analysis_record(*, moments: list[Moment], raw: dict[str, object] | None = None) -> AnalysisRecord:
-    clip_id = uuid4()
+    clip_id = tuid()
     return AnalysisRecord(
         clip_id=clip_id,
         summary="",
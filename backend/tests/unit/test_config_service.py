@@ -1,31 +1,18 @@
 from __future__ import annotations
 
-from collections.abc import AsyncIterator
-
 import pytest
-import pytest_asyncio
 
-from backend.app.db import dispose_engine, ensure_database_ready
 from backend.app.models.config import ConfigUpdateRequest, ModelParams
 from backend.app.services.config_service import ConfigService
 from backend.app.services.config_store import ConfigStore
 
-DATABASE_URL = "sqlite+aiosqlite:///:memory:"
-
 
-@pytest_asyncio.fixture
-async def config_service() -> AsyncIterator[ConfigService]:
-    await ensure_database_ready(DATABASE_URL)
-    store = ConfigStore(DATABASE_URL)
-    service = ConfigService(store)
-    try:
-        yield service
-    finally:
-        await store.close()
-        await dispose_engine(DATABASE_URL)
+@pytest.fixture
+def config_service(config_store: ConfigStore) -> ConfigService:
+    return ConfigService(config_store)
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="session")
 async def test_get_configuration_returns_defaults(config_service: ConfigService) -> None:
     response = await config_service.get_configuration()
 
@@ -35,7 +22,7 @@ async def test_get_configuration_returns_defaults(config_service: ConfigService)
     assert response.theme is None
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="session")
 async def test_update_configuration_persists_model_and_flags(config_service: ConfigService) -> None:
     payload = ConfigUpdateRequest(
         model=ModelParams(fps=30, temperature=0.5, max_tokens=4096, default_prompt="  Summarize " ),
@@ -56,7 +43,7 @@ async def test_update_configuration_persists_model_and_flags(config_service: Con
     assert subsequent.flags["ENABLE_LIVE_MODE"] is True
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="session")
 async def test_get_flags_coerces_truthy_strings(config_service: ConfigService) -> None:
     await config_service._store.update(  # type: ignore[attr-defined]
         feature_flags={"ENABLE_GRAPH_VIEW": "true", "EXPERIMENTAL": 0}
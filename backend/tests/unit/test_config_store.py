@@ -1,34 +1,14 @@
 from __future__ import annotations
 
 import json
-from collections.abc import AsyncIterator
 from typing import Any
 
 import pytest
-import pytest_asyncio
 
-from backend.app.db import dispose_engine, ensure_database_ready
 from backend.app.services.config_store import ConfigSnapshot, ConfigStore
 
-DATABASE_URL = "sqlite+aiosqlite:///:memory:"
 
-
-async def _prepare_store() -> ConfigStore:
-    await ensure_database_ready(DATABASE_URL)
-    return ConfigStore(DATABASE_URL)
-
-
-@pytest_asyncio.fixture
-async def config_store() -> AsyncIterator[ConfigStore]:
-    store = await _prepare_store()
-    try:
-        yield store
-    finally:
-        await store.close()
-        await dispose_engine(DATABASE_URL)
-
-
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="session")
 async def test_fetch_sets_defaults_when_empty(config_store: ConfigStore) -> None:
     snapshot = await config_store.fetch()
 
@@ -40,7 +20,7 @@ async def test_fetch_sets_defaults_when_empty(config_store: ConfigStore) -> None
     )
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="session")
 async def test_env_feature_flags_override_persisted_values(
     config_store: ConfigStore,
     monkeypatch: pytest.MonkeyPatch,
@@ -61,7 +41,22 @@ async def test_env_feature_flags_override_persisted_values(
     assert snapshot.model_params["fps"] == 24
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="session")
+async def test_env_feature_flag_overrides_are_not_shared_between_snapshots(
+    config_store: ConfigStore,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setenv("CLIPNOTES_FEATURE_FLAGS", json.dumps({"ROLLOUT": {"regions": ["eu"]}}))
+
+    first = await config_store.fetch()
+    first.feature_flags["ROLLOUT"]["regions"].append("us")
+
+    second = await config_store.fetch()
+
+    assert second.feature_flags["ROLLOUT"] == {"regions": ["eu"]}
+
+
+@pytest.mark.asyncio(loop_scope="session")
 async def test_theme_default_env_applies_even_without_saved_overrides(
     config_store: ConfigStore,
     monkeypatch: pytest.MonkeyPatch,
@@ -75,7 +70,7 @@ async def test_theme_default_env_applies_even_without_saved_overrides(
     assert snapshot.theme_overrides == {"mode": "dark"}
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="session")
 async def test_env_overrides_respected_after_store_updates(
     config_store: ConfigStore,
     monkeypatch: pytest.MonkeyPatch,
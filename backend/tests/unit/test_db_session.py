@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+import pytest
+from sqlalchemy import text
+
+from backend.app.db import dispose_engine, get_engine
+from backend.app.db.session import _build_engine
+from backend.app.store.sqlite import memory_database_url
+
+
+async def _read_pragmas(database_url: str) -> dict[str, object]:
+    # Build an uncached engine so the check neither reuses nor disposes one the app still holds.
+    engine = _build_engine(database_url)
+    try:
+        async with engine.connect() as connection:
+            return {
+                name: (await connection.execute(text(f"PRAGMA {name}"))).scalar()
+                for name in ("journal_mode", "synchronous", "temp_store", "busy_timeout", "page_size", "mmap_size")
+            }
+    finally:
+        await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_file_sqlite_connections_use_wal(tmp_path) -> None:
+    pragmas = await _read_pragmas(f"sqlite+aiosqlite:///{tmp_path/'pragmas.db'}")
+
+    assert pragmas["journal_mode"] == "wal"
+    assert pragmas["synchronous"] == 1  # NORMAL
+    assert pragmas["temp_store"] == 2  # MEMORY
+    assert pragmas["busy_timeout"] == 5000
+    assert pragmas["page_size"] == 8192
+    assert pragmas["mmap_size"] == 268435456
+
+
+@pytest.mark.asyncio
+async def test_memory_sqlite_connections_skip_wal() -> None:
+    pragmas = await _read_pragmas("sqlite+aiosqlite:///:memory:")
+
+    assert pragmas["journal_mode"] == "memory"
+    assert pragmas["synchronous"] == 0  # OFF
+
+
+@pytest.mark.asyncio
+async def test_dispose_engine_keeps_other_urls_cached() -> None:
+    kept_url, disposed_url = memory_database_url(), memory_database_url()
+    kept = get_engine(kept_url)
+    try:
+        disposed = get_engine(disposed_url)
+        await dispose_engine(disposed_url)
+
+        assert get_engine(kept_url) is kept
+        assert get_engine(disposed_url) is not disposed
+    finally:
+        await dispose_engine(disposed_url)
+        await dispose_engine(kept_url)
@@ -1,16 +1,15 @@
 from __future__ import annotations
 
-from uuid import UUID, uuid4
+from uuid import uuid4
 
 import pytest
 
+from backend.app.services.hafnia import FakeHafniaClient
 from backend.app.store import AnalysisPayload
 
 
 @pytest.mark.asyncio
 async def test_fake_hafnia_client_returns_structured_payload():
-    from backend.app.services.hafnia import FakeHafniaClient
-
     client = FakeHafniaClient()
     clip_id = uuid4()
 
@@ -35,8 +34,6 @@ async def test_fake_hafnia_client_returns_structured_payload():
 
 @pytest.mark.asyncio
 async def test_fake_hafnia_client_can_simulate_failure():
-    from backend.app.services.hafnia import FakeHafniaClient
-
     client = FakeHafniaClient()
     client.set_next_error(code="hafnia_timeout", message="Timed out", latency_ms=9100)
 
@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+from email import message_from_bytes
+from email.message import Message
+from typing import cast
+
+import httpx
+import pytest
+from fastapi import UploadFile
+from pydantic import HttpUrl
+
+from backend.app.core.config import Settings
+from backend.app.services.hafnia_client import HafniaClient, HafniaClientError
+
+
+@pytest.fixture(scope="module")
+def settings() -> Settings:
+    return Settings(
+        hafnia_api_key="test-key",
+        hafnia_base_url=cast(HttpUrl, "https://example.com"),
+    )
+
+
+def _file_part(request: httpx.Request) -> Message:
+    # Parse the body with the stdlib MIME parser so the test doesn't trust our own encoder.
+    envelope = f"Content-Type: {request.headers['Content-Type']}\r\n\r\n".encode() + request.content
+    parts = message_from_bytes(envelope).get_payload()
+    assert isinstance(parts, list) and len(parts) == 1
+    return parts[0]
+
+
+@pytest.mark.asyncio
+async def test_upload_asset_streams_file_as_multipart(settings: Settings, video_upload: UploadFile) -> None:
+    requests: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        if len(requests) == 1:
+            return httpx.Response(503)
+        return httpx.Response(200, json={"asset_id": "asset-123"})
+
+    client = HafniaClient(settings=settings, backoff_base=0.0, transport=httpx.MockTransport(handler))
+
+    asset_id = await client.upload_asset(video_upload)
+
+    assert asset_id == "asset-123"
+    # The retry rewinds the file, so both attempts carry the full clip.
+    assert len(requests) == 2
+    for request in requests:
+        assert request.url.path == "/assets"
+        assert request.headers["Authorization"] == settings.headers["Authorization"]
+        assert int(request.headers["Content-Length"]) == len(request.content)
+        part = _file_part(request)
+        assert part.get_param("name", header="Content-Disposition") == "file"
+        assert part.get_filename() == "clip.mp4"
+        assert part.get_content_type() == "video/mp4"
+        assert part.get_payload(decode=True) == b"binary-video"
+    assert await video_upload.read() == b"binary-video"
+
+
+@pytest.mark.asyncio
+async def test_upload_asset_rewinds_file_after_failure(settings: Settings, video_upload: UploadFile) -> None:
+    client = HafniaClient(
+        settings=settings,
+        max_attempts=1,
+        transport=httpx.MockTransport(lambda request: httpx.Response(500)),
+    )
+
+    with pytest.raises(HafniaClientError):
+        await client.upload_asset(video_upload)
+
+    assert await video_upload.read() == b"binary-video"
@@ -1,92 +1,139 @@
 from __future__ import annotations
 
-from datetime import datetime, timedelta, timezone
+from collections.abc import AsyncIterator
+from datetime import date, datetime, timedelta, timezone
+from uuid import uuid4
 
 import pytest
-from sqlalchemy import select
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+import pytest_asyncio
+from sqlalchemy import insert
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.asyncio import AsyncEngine
 
+from backend.app.db import Base, ensure_database_ready, get_engine
 from backend.app.models.config import RequestCountModel
-from backend.app.services.metrics_service import MetricsService
-from backend.app.store.base import AnalysisPayload, Moment
-from backend.app.store.sqlite import AnalysisModel, ClipModel, SqliteStore
+from backend.app.models.metrics import MetricsResponse
+from backend.app.services.metrics_service import MetricsService, _utc_date
+from backend.app.store.sqlite import AnalysisModel, ClipModel
+from backend.tests._helpers import tuid
 
 
-@pytest.mark.asyncio
-async def test_metrics_snapshot_returns_zeros_when_empty(tmp_path) -> None:
-    database_url = f"sqlite+aiosqlite:///{tmp_path/'metrics.db'}"
-    service = MetricsService(database_url)
+@pytest.fixture(scope="module")
+def metrics_database_url() -> str:
+    return f"sqlite+aiosqlite:///file:metrics-{uuid4().hex}?mode=memory&cache=shared&uri=true"
 
-    snapshot = await service.get_metrics(now=datetime(2025, 1, 1, tzinfo=timezone.utc))
 
-    assert snapshot.total_clips == 0
-    assert snapshot.total_analyses == 0
-    assert snapshot.requests_today == 0
-    assert snapshot.clips_today == 0
-    assert snapshot.avg_latency_ms == 0.0
-    assert snapshot.latency_flag is False
-    assert snapshot.error_rate is None
-    assert snapshot.per_hour == []
-    assert snapshot.per_day == []
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
+async def _module_metrics_engine(metrics_database_url: str) -> AsyncIterator[AsyncEngine]:
+    await ensure_database_ready(metrics_database_url)
+    engine = get_engine(metrics_database_url)
+    try:
+        yield engine
+    finally:
+        await engine.dispose()
 
-    await service.close()
 
+@pytest_asyncio.fixture(loop_scope="module")
+async def metrics_engine(_module_metrics_engine: AsyncEngine) -> AsyncIterator[AsyncEngine]:
+    """Yield the module's engine, emptying every table after each test."""
 
-@pytest.mark.asyncio
-async def test_metrics_snapshot_includes_recent_activity(tmp_path) -> None:
-    database_url = f"sqlite+aiosqlite:///{tmp_path/'metrics.db'}"
-    store = SqliteStore(database_url)
-    now = datetime(2025, 11, 3, 15, 30, tzinfo=timezone.utc)
+    engine = _module_metrics_engine
+    try:
+        yield engine
+    finally:
+        async with engine.begin() as connection:
+            for table in reversed(Base.metadata.sorted_tables):
+                await connection.execute(table.delete())
+
+
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
+async def empty_snapshot(_module_metrics_engine: AsyncEngine) -> MetricsResponse:
+    """Compute the snapshot of an empty database once for every assertion that needs it."""
+
+    service = MetricsService(engine=_module_metrics_engine)
+    try:
+        return await service.get_metrics(now=datetime(2025, 1, 1, tzinfo=timezone.utc))
+    finally:
+        await service.close()
+
+
+def test_metrics_snapshot_returns_zero_totals_when_empty(empty_snapshot: MetricsResponse) -> None:
+    assert empty_snapshot.total_clips == 0
+    assert empty_snapshot.total_analyses == 0
+    assert empty_snapshot.requests_today == 0
+    assert empty_snapshot.clips_today == 0
+
+
+def test_metrics_snapshot_reports_no_latency_or_errors_when_empty(empty_snapshot: MetricsResponse) -> None:
+    assert empty_snapshot.avg_latency_ms == 0.0
+    assert empty_snapshot.latency_flag is False
+    assert empty_snapshot.error_rate is None
+
+
+def test_metrics_snapshot_has_no_buckets_when_empty(empty_snapshot: MetricsResponse) -> None:
+    assert empty_snapshot.per_hour == []
+    assert empty_snapshot.per_day == []
 
-    # Seed clips
-    clip_one = await store.create_clip(filename="first.mp4")
-    clip_two = await store.create_clip(filename="second.mp4")
-
-    # Seed analyses with explicit timestamps
-    payload_ok = AnalysisPayload(
-        summary="ok",
-        moments=[Moment(start_s=0.0, end_s=1.0, label="intro", severity="low")],
-        raw={},
-        latency_ms=5200,
-    )
-    payload_warn = AnalysisPayload(
-        summary="slow",
-        moments=[Moment(start_s=1.0, end_s=2.0, label="middle", severity="medium")],
-        raw={},
-        latency_ms=6800,
-    )
-    payload_error = AnalysisPayload(
-        summary=None,
-        moments=[],
-        raw={},
-        latency_ms=None,
-        error_code="timeout",
-        error_message="Timed out",
-    )
-
-    await store.save_analysis(clip_one.id, payload_ok)
-    await store.save_analysis(clip_one.id, payload_warn)
-    await store.save_analysis(clip_two.id, payload_error)
-
-    engine = create_async_engine(database_url, echo=False)
-    sessions: async_sessionmaker[AsyncSession] = async_sessionmaker(engine, expire_on_commit=False)
-
-    async with sessions() as session:
-        rows = (await session.execute(select(AnalysisModel))).scalars().all()
-        # Assign deterministic timestamps: two analyses today, one yesterday
-        rows[0].created_at = now - timedelta(hours=1)
-        rows[1].created_at = now - timedelta(hours=5)
-        rows[2].created_at = now - timedelta(days=1, hours=3)
-        await session.commit()
-
-    # Seed request counters for current and previous day
-    async with sessions() as session:
-        today_row = RequestCountModel(date=now.date(), requests=37)
-        yesterday_row = RequestCountModel(date=now.date() - timedelta(days=1), requests=22)
-        session.add_all([today_row, yesterday_row])
-        await session.commit()
-
-    service = MetricsService(database_url, latency_warning_threshold_ms=5000)
+
+@pytest.mark.asyncio(loop_scope="module")
+async def test_metrics_snapshot_includes_recent_activity(metrics_engine: AsyncEngine) -> None:
+    now = datetime(2025, 11, 3, 15, 30, tzinfo=timezone.utc)
+    clip_one = str(tuid())
+    clip_two = str(tuid())
+
+    analysis_rows = [
+        {
+            "clip_id": clip_one,
+            "summary": "ok",
+            "moments": [{"start_s": 0.0, "end_s": 1.0, "label": "intro", "severity": "low"}],
+            "raw": {},
+            "created_at": now - timedelta(hours=1),
+            "latency_ms": 5200,
+            "error_code": None,
+            "error_message": None,
+        },
+        {
+            "clip_id": clip_one,
+            "summary": "slow",
+            "moments": [{"start_s": 1.0, "end_s": 2.0, "label": "middle", "severity": "medium"}],
+            "raw": {},
+            "created_at": now - timedelta(hours=5),
+            "latency_ms": 6800,
+            "error_code": None,
+            "error_message": None,
+        },
+        {
+            "clip_id": clip_two,
+            "summary": None,
+            "moments": [],
+            "raw": {},
+            "created_at": now - timedelta(days=1, hours=3),
+            "latency_ms": None,
+            "error_code": "timeout",
+            "error_message": "Timed out",
+        },
+    ]
+
+    # Seed clips, analyses (two today, one yesterday) and request counters in one
+    # transaction, each table as a single executemany.
+    async with metrics_engine.begin() as connection:
+        await connection.execute(
+            insert(ClipModel),
+            [
+                {"id": clip_one, "filename": "first.mp4", "status": "ready"},
+                {"id": clip_two, "filename": "second.mp4", "status": "failed"},
+            ],
+        )
+        await connection.execute(insert(AnalysisModel), analysis_rows)
+        await connection.execute(
+            insert(RequestCountModel),
+            [
+                {"date": now.date(), "requests": 37},
+                {"date": now.date() - timedelta(days=1), "requests": 22},
+            ],
+        )
+
+    service = MetricsService(engine=metrics_engine, latency_warning_threshold_ms=5000)
     snapshot = await service.get_metrics(now=now)
 
     assert snapshot.total_clips == 2
@@ -102,6 +149,43 @@ async def test_metrics_snapshot_includes_recent_activity(tmp_path) -> None:
     assert today_bucket.requests == 37
     assert today_bucket.analyses == 2
 
+    assert [(bucket.hour, bucket.requests) for bucket in snapshot.per_hour] == [
+        (datetime(2025, 11, 3, 10, tzinfo=timezone.utc), 1),
+        (datetime(2025, 11, 3, 14, tzinfo=timezone.utc), 1),
+    ]
+
     await service.close()
-    await store.close()
-    await engine.dispose()
\ No newline at end of file
+
+
+@pytest.mark.asyncio(loop_scope="module")
+async def test_metrics_daily_buckets_split_on_utc_midnight(metrics_engine: AsyncEngine) -> None:
+    now = datetime(2025, 11, 3, 6, 0, tzinfo=timezone.utc)
+    clip_id = str(tuid())
+    midnight = datetime(2025, 11, 3, tzinfo=timezone.utc)
+
+    async with metrics_engine.begin() as connection:
+        await connection.execute(insert(ClipModel), [{"id": clip_id, "filename": "night.mp4", "status": "ready"}])
+        await connection.execute(
+            insert(AnalysisModel),
+            [
+                {"clip_id": clip_id, "moments": [], "raw": {}, "created_at": midnight - timedelta(seconds=30)},
+                {"clip_id": clip_id, "moments": [], "raw": {}, "created_at": midnight + timedelta(seconds=30)},
+                {"clip_id": clip_id, "moments": [], "raw": {}, "created_at": midnight + timedelta(minutes=5)},
+            ],
+        )
+
+    snapshot = await MetricsService(engine=metrics_engine).get_metrics(now=now)
+
+    assert [(bucket.date, bucket.analyses) for bucket in snapshot.per_day] == [
+        (date(2025, 11, 2), 1),
+        (date(2025, 11, 3), 2),
+    ]
+    assert snapshot.clips_today == 2
+
+
+def test_utc_date_converts_postgres_timestamps_to_utc() -> None:
+    expression = _utc_date(AnalysisModel.created_at, "postgresql")
+
+    compiled = str(expression.compile(dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}))
+
+    assert compiled == "date(timezone('UTC', analysis_results.created_at))"
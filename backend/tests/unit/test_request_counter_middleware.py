@@ -1,19 +1,22 @@
 from __future__ import annotations
 
+import asyncio
 from datetime import datetime, timezone
 
 import pytest
 from fastapi import FastAPI
 from httpx import ASGITransport, AsyncClient
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
 from backend.app.api.middleware.request_counter import RequestCounterMiddleware
+from backend.app.db import get_engine, get_sessionmaker
 from backend.app.models.config import RequestCountModel
 
 
 @pytest.mark.asyncio
-async def test_request_counter_tracks_api_requests(tmp_path) -> None:
-    database_url = f"sqlite+aiosqlite:///{tmp_path/'request-count.db'}"
+async def test_request_counter_tracks_api_requests(memory_database_url: str) -> None:
+    database_url = memory_database_url
 
     app = FastAPI()
     app.add_middleware(RequestCounterMiddleware, database_url=database_url)
@@ -35,14 +38,24 @@ async def test_request_counter_tracks_api_requests(tmp_path) -> None:
         response = await client.options("/api/ping")
         assert response.status_code == 200
 
-        # Two API hits we expect to be counted.
-        response = await client.get("/api/ping")
-        assert response.status_code == 200
-        response = await client.get("/api/ping")
-        assert response.status_code == 200
+        # Two concurrent API hits we expect to be counted, each with a single statement.
+        counter_statements: list[str] = []
+
+        def _record(_conn, _cursor, statement, *_args) -> None:
+            if "request_counts" in statement and statement.startswith(("SELECT", "INSERT", "UPDATE")):
+                counter_statements.append(statement)
 
-    engine = create_async_engine(database_url, echo=False)
-    sessions: async_sessionmaker[AsyncSession] = async_sessionmaker(engine, expire_on_commit=False)
+        sync_engine = get_engine(database_url).sync_engine
+        event.listen(sync_engine, "before_cursor_execute", _record)
+        try:
+            responses = await asyncio.gather(client.get("/api/ping"), client.get("/api/ping"))
+        finally:
+            event.remove(sync_engine, "before_cursor_execute", _record)
+        assert [item.status_code for item in responses] == [200, 200]
+        assert len(counter_statements) == 2
+        assert all(statement.startswith("INSERT") for statement in counter_statements)
+
+    sessions: async_sessionmaker[AsyncSession] = get_sessionmaker(database_url)
 
     today = datetime.now(timezone.utc).date()
 
@@ -50,5 +63,3 @@ async def test_request_counter_tracks_api_requests(tmp_path) -> None:
         row = await session.get(RequestCountModel, today)
         assert row is not None
         assert row.requests == 2
-
-    await engine.dispose()
@@ -1,24 +1,19 @@
 from __future__ import annotations
 
-from collections.abc import AsyncIterator
+import asyncio
 from datetime import timezone
 
 import pytest
-import pytest_asyncio
 
-from backend.app.store import ClipRecord, ClipStore
+from backend.app.store import ClipRecord, ClipStore, SqliteStore
 
+_STORE_FIXTURES = {"memory": "memory_store", "sqlite": "sqlite_store"}
 
-@pytest_asyncio.fixture(params=["memory", "sqlite"], name="clip_store")
-async def fixture_clip_store(
-    request: pytest.FixtureRequest,
-    memory_store,
-    sqlite_store,
-) -> AsyncIterator[ClipStore]:
-    if request.param == "sqlite":
-        yield sqlite_store
-    else:
-        yield memory_store
+
+@pytest.fixture(params=list(_STORE_FIXTURES), ids=list(_STORE_FIXTURES), name="clip_store")
+def fixture_clip_store(request: pytest.FixtureRequest) -> ClipStore:
+    # Resolve only the backend this parametrization needs instead of building both.
+    return request.getfixturevalue(_STORE_FIXTURES[request.param])
 
 
 @pytest.mark.asyncio
@@ -45,10 +40,28 @@ async def test_list_clips_orders_newest_first(clip_store: ClipStore) -> None:
 
 @pytest.mark.asyncio
 async def test_list_clips_honors_limit(clip_store: ClipStore) -> None:
-    for index in range(4):
-        await clip_store.create_clip(filename=f"clip-{index}.mp4")
+    await asyncio.gather(*(clip_store.create_clip(filename=f"clip-{index}.mp4") for index in range(4)))
 
     results = await clip_store.list_clips(limit=2)
 
     assert len(results) == 2
     assert len({item.id for item in results}) == 2
+
+
+@pytest.mark.asyncio
+async def test_bulk_seed_stores_clips_with_analyses(sqlite_store: SqliteStore, analysis_payload_factory) -> None:
+    seeded = await sqlite_store.bulk_seed(
+        [
+            ("harbor.mp4", analysis_payload_factory()),
+            ("failed.mp4", analysis_payload_factory(error_code="hafnia_unavailable")),
+        ]
+    )
+
+    assert len(seeded) == 2
+    ready = await sqlite_store.get_clip(seeded[0].clip_id)
+    failed = await sqlite_store.get_clip(seeded[1].clip_id)
+    assert ready is not None and ready.status == "ready"
+    assert failed is not None and failed.status == "failed"
+    latest = await sqlite_store.get_latest_analysis(seeded[0].clip_id)
+    assert latest is not None
+    assert latest.summary == "Clip processed successfully."
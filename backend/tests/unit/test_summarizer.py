@@ -1,5 +1,3 @@
-import io
-
 import pytest
 from fastapi import UploadFile
 
@@ -30,16 +28,11 @@ class StubHafniaClient:
 
 
 @pytest.mark.asyncio
-async def test_summarizer_process_returns_response():
+async def test_summarizer_process_returns_response(video_upload: UploadFile):
     client = StubHafniaClient()
     summarizer = Summarizer(client=client)  # type: ignore[arg-type]
 
-    upload = UploadFile(
-        filename="clip.mp4",
-        file=io.BytesIO(b"binary-video"),
-    )
-
-    result = await summarizer.process(upload)
+    result = await summarizer.process(video_upload)
 
     assert isinstance(result, SummaryResponse)
     assert result.summary == ["Cyclist crosses street", "Car stops at red light"]
@@ -49,17 +42,12 @@ async def test_summarizer_process_returns_response():
 
 
 @pytest.mark.asyncio
-async def test_summarizer_records_session_registry():
+async def test_summarizer_records_session_registry(video_upload: UploadFile):
     client = StubHafniaClient()
     registry = SessionRegistry()
     summarizer = Summarizer(client=client, registry=registry)  # type: ignore[arg-type]
 
-    upload = UploadFile(
-        filename="clip.mp4",
-        file=io.BytesIO(b"binary-video"),
-    )
-
-    result = await summarizer.process(upload)
+    result = await summarizer.process(video_upload)
 
     stored = registry.get(result.submission_id)
     assert stored.asset_id == "asset-123"